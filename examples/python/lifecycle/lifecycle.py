@@ -29,9 +29,10 @@ if response.exit_code != 0:
 else:
     print(response.result)
 
-workspaces = daytona.list()
-print("Total workspaces count:" , len(workspaces))
-pprint(vars(workspaces[0].info()))  # This will show all attributes of the first workspace
+summaries = daytona.list_summaries()
+print("Total workspaces count:" , len(summaries))
+first_workspace = daytona.get_current_workspace(summaries[0].id)
+pprint(vars(first_workspace.info()))  # This will show all attributes of the first workspace
 
 print("Removing workspace")
 daytona.remove(workspace)
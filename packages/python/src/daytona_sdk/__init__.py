@@ -1,17 +1,39 @@
-from .daytona import (
-    Daytona,
-    DaytonaConfig,
-    CreateWorkspaceParams,
-    CodeLanguage,
-    Workspace,
-    SessionExecuteRequest,
-    SessionExecuteResponse,
-    DaytonaError,
-    WorkspaceTargetRegion,
-)
-from .lsp_server import LspLanguageId
-from .workspace import WorkspaceState
-from .common.code_run_params import CodeRunParams
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .daytona import (
+        Daytona,
+        DaytonaConfig,
+        CreateWorkspaceParams,
+        CodeLanguage,
+        Workspace,
+        SessionExecuteRequest,
+        SessionExecuteResponse,
+        DaytonaError,
+        WorkspaceTargetRegion,
+    )
+    from .lsp_server import LspLanguageId
+    from .workspace import WorkspaceState, WorkspaceSummary
+    from .common.code_run_params import CodeRunParams
+
+# Public names and the submodules they are imported from on first access (PEP 562),
+# so importing the package doesn't pull in the API client and every component up front
+_LAZY_IMPORTS = {
+    "Daytona": ".daytona",
+    "DaytonaConfig": ".daytona",
+    "CreateWorkspaceParams": ".daytona",
+    "CodeLanguage": ".daytona",
+    "Workspace": ".daytona",
+    "SessionExecuteRequest": ".daytona",
+    "SessionExecuteResponse": ".daytona",
+    "DaytonaError": ".daytona",
+    "WorkspaceTargetRegion": ".daytona",
+    "LspLanguageId": ".lsp_server",
+    "WorkspaceState": ".workspace",
+    "WorkspaceSummary": ".workspace",
+    "CodeRunParams": ".common.code_run_params",
+}
 
 __all__ = [
     "Daytona",
@@ -25,5 +47,21 @@ __all__ = [
     "LspLanguageId",
     "WorkspaceTargetRegion",
     "WorkspaceState",
+    "WorkspaceSummary",
     "CodeRunParams"
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,59 @@
+import asyncio
+import concurrent.futures
+from typing import Any, Callable, Iterable, List, TypeVar
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def map_concurrently(func: Callable[[T], R], items: Iterable[T], max_workers: int = 16) -> List[R]:
+    """Calls a function for each item on a dedicated thread pool.
+
+    All calls are allowed to finish before returning. If any of them failed,
+    the first exception to be raised is re-raised.
+
+    Args:
+        func (Callable[[T], R]): The function to call for each item.
+        items (Iterable[T]): The items to call the function with.
+        max_workers (int): Maximum number of calls running at the same time.
+
+    Returns:
+        List[R]: The results, in the same order as the items.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if len(items) == 1:
+        # Nothing to overlap, so don't pay for spinning up a pool
+        return [func(items[0])]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+
+        first_error = None
+        for future in concurrent.futures.as_completed(futures):
+            error = future.exception()
+            if error is not None and first_error is None:
+                first_error = error
+
+    if first_error is not None:
+        raise first_error
+
+    return [future.result() for future in futures]
+
+
+async def run_in_thread(semaphore: asyncio.Semaphore, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """Runs a blocking call on a worker thread without blocking the event loop.
+
+    Args:
+        semaphore (asyncio.Semaphore): Semaphore limiting how many calls run at the same time.
+        func (Callable[..., R]): The blocking function to call.
+        *args: Positional arguments to call the function with.
+        **kwargs: Keyword arguments to call the function with.
+
+    Returns:
+        R: The result of the call.
+    """
+    async with semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
@@ -14,7 +14,5 @@ def to_enum(enum_class: type, value: str) -> Optional[Enum]:
     """
     if isinstance(value, enum_class):
         return value
-    str_value = str(value)
-    if str_value in enum_class._value2member_map_:
-        return enum_class(str_value)
-    return None
+    # Same O(1) value lookup as the enums' own `from_str`, without raising on a miss
+    return enum_class._value2member_map_.get(value if isinstance(value, str) else str(value))
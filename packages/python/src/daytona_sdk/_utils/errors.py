@@ -21,20 +21,34 @@ def intercept_errors(message_prefix: str = "") -> Callable[[Callable[P, T]], Cal
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             try:
                 return func(*args, **kwargs)
-            except OpenApiException as e:
-                message = _get_open_api_exception_message(e)
-
-                raise DaytonaError(f"{message_prefix}{message}") from None
             except Exception as e:
-                if message_prefix:
-                    message = f"{message_prefix}{str(e)}"
-                    raise DaytonaError(message)
-                raise DaytonaError(str(e))
+                raise to_daytona_error(e, message_prefix)
 
         return wrapper
     return decorator
 
 
+def to_daytona_error(error: Exception, message_prefix: str = "") -> DaytonaError:
+    """Converts an exception into the DaytonaError raised by intercept_errors.
+
+    Meant for hot methods that handle errors inline instead of being decorated:
+    `except Exception as e: raise to_daytona_error(e, "Failed to ...: ")`.
+
+    Args:
+        error (Exception): The exception to convert.
+        message_prefix (str): Custom message prefix for the error.
+
+    Returns:
+        DaytonaError: The error to raise. For API exceptions, the original exception
+            is hidden from the traceback like `raise ... from None` does.
+    """
+    if isinstance(error, OpenApiException):
+        daytona_error = DaytonaError(f"{message_prefix}{_get_open_api_exception_message(error)}")
+        daytona_error.__suppress_context__ = True
+        return daytona_error
+    return DaytonaError(f"{message_prefix}{error}")
+
+
 def _get_open_api_exception_message(exception: OpenApiException) -> str:
     """Process API exceptions to extract the most meaningful error message.
 
@@ -53,12 +67,22 @@ def _get_open_api_exception_message(exception: OpenApiException) -> str:
     if not hasattr(exception, 'body') or not exception.body:
         return str(exception)
 
-    body_str = str(exception.body)
-    try:
-        data = json.loads(body_str)
-        message = data.get('message', body_str) if isinstance(
-            data, dict) else body_str
-    except json.JSONDecodeError:
-        message = body_str
+    body = exception.body
+    if isinstance(body, bytes):
+        body_str = body.decode('utf-8', 'replace')
+    elif isinstance(body, str):
+        body_str = body
+    else:
+        body_str = str(body)
+
+    # Only JSON objects can carry a 'message' field, skip parsing anything else
+    stripped = body_str.lstrip()
+    if stripped.startswith('{'):
+        try:
+            data = json.loads(stripped)
+            if isinstance(data, dict) and 'message' in data:
+                return data['message']
+        except json.JSONDecodeError:
+            pass
 
-    return message
+    return body_str
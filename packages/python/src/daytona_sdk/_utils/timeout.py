@@ -1,4 +1,6 @@
 import functools
+import threading
+import time
 import concurrent.futures
 from typing import Callable, Optional, Any, TypeVar, ParamSpec
 from daytona_sdk._utils.errors import DaytonaError
@@ -7,26 +9,119 @@ from daytona_sdk._utils.errors import DaytonaError
 P = ParamSpec('P')
 T = TypeVar('T')
 
+_TIMEOUT_THREAD_PREFIX = "daytona-timeout"
+_TIMEOUT_POOL_SIZE = 32
 
-def with_timeout(error_message: Optional[Callable[[Any, float], str]] = None) -> Callable[[Callable[P, T]], Callable[P, T]]:
+# Shared executor used to run timed calls, so a decorated call doesn't have to
+# spin up and tear down its own worker thread.
+_TIMEOUT_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_TIMEOUT_POOL_SIZE, thread_name_prefix=_TIMEOUT_THREAD_PREFIX)
+
+# Number of timed calls submitted to the pool that haven't finished yet
+_pool_calls = 0
+_pool_calls_lock = threading.Lock()
+
+# Absolute time.monotonic() deadline of the timed call running on the current thread
+_local = threading.local()
+
+
+def remaining_time() -> Optional[float]:
+    """Returns the seconds left before the timed call running on this thread times out.
+
+    The caller of a timed call gets its TimeoutError at the deadline, but the call
+    itself can't be interrupted. Long-running loops inside timed calls check this
+    to stop once nobody is waiting for them anymore.
+
+    Returns:
+        Optional[float]: The seconds left, 0 or less once the deadline has passed.
+            None when not running under a timeout.
+    """
+    deadline = getattr(_local, "deadline", None)
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def _run_until(deadline: float, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a call with its deadline visible to remaining_time()."""
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = deadline
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _local.deadline = previous
+
+
+def _release_pool_slot(_: concurrent.futures.Future) -> None:
+    global _pool_calls
+    with _pool_calls_lock:
+        _pool_calls -= 1
+
+
+def _submit(func: Callable[..., T], *args: Any, **kwargs: Any) -> "concurrent.futures.Future[T]":
+    """Starts a timed call on a pool worker, or on a dedicated thread if all workers are busy.
+
+    A call must start running right away: its timeout is measured from submission,
+    so time spent queued behind other calls would count against it.
+    """
+    global _pool_calls
+    with _pool_calls_lock:
+        use_pool = _pool_calls < _TIMEOUT_POOL_SIZE
+        if use_pool:
+            _pool_calls += 1
+
+    if use_pool:
+        future = _TIMEOUT_POOL.submit(func, *args, **kwargs)
+        future.add_done_callback(_release_pool_slot)
+        return future
+
+    future = concurrent.futures.Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    # Not a daemon, like the pool workers, so calls such as cleanups aren't cut off at exit
+    threading.Thread(target=run, name=f"{_TIMEOUT_THREAD_PREFIX}-overflow").start()
+    return future
+
+
+def with_timeout(
+    error_message: Optional[Callable[[Any, float], str]] = None,
+    on_timeout: Optional[Callable[..., None]] = None,
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator to add a timeout mechanism with an optional custom error message.
 
     Args:
         error_message (Optional[Callable[[Any, float], str]]): A callable that accepts `self` and `timeout`,
                                                                and returns a string error message.
+        on_timeout (Optional[Callable[..., None]]): Called with the call's arguments if a call that
+                                                    timed out still goes on to succeed, e.g. to undo
+                                                    what it did. Failures are left to the call itself.
+
+    A timed call can't be interrupted, but it can see its deadline through remaining_time()
+    and is expected to stop by itself once it has passed. Timed calls made from within a
+    timed call are held to whichever of the two deadlines comes first.
     """
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        # Get function argument names and the position of 'timeout' among them
+        arg_names = func.__code__.co_varnames[:func.__code__.co_argcount]
+        timeout_index = arg_names.index(
+            'timeout') if 'timeout' in arg_names else -1
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            # Get function argument names
-            arg_names = func.__code__.co_varnames[:func.__code__.co_argcount]
-            arg_dict = dict(zip(arg_names, args))
-
-            # Extract self if method is bound
-            self_instance = args[0] if args else None
-
             # Check for 'timeout' in kwargs first, then in positional arguments
-            timeout = kwargs.get('timeout', arg_dict.get('timeout', None))
+            timeout = kwargs.get('timeout')
+            if timeout is None:
+                if not 0 <= timeout_index < len(args):
+                    # No timeout was passed at all, which is the common case
+                    return func(*args, **kwargs)
+                timeout = args[timeout_index]
 
             if timeout is None or timeout == 0:
                 # If timeout is None or 0, run the function normally
@@ -36,14 +131,31 @@ def with_timeout(error_message: Optional[Callable[[Any, float], str]] = None) ->
                 raise DaytonaError(
                     "Timeout must be a non-negative number or None.")
 
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(func, *args, **kwargs)
-                try:
-                    return future.result(timeout=timeout)
-                except concurrent.futures.TimeoutError:
-                    # Use custom error message if provided, otherwise default
-                    msg = error_message(
-                        self_instance, timeout) if error_message else f"Function '{func.__name__}' exceeded timeout of {timeout} seconds."
-                    raise TimeoutError(msg)
+            deadline = time.monotonic() + timeout
+            outer_remaining = remaining_time()
+            if outer_remaining is not None:
+                # Nested under another timed call, which may run out first
+                deadline = min(deadline, time.monotonic() + outer_remaining)
+
+            # _submit never queues, so nested calls can't exhaust the pool
+            future = _submit(_run_until, deadline, func, *args, **kwargs)
+            try:
+                return future.result(timeout=max(deadline - time.monotonic(), 0))
+            except concurrent.futures.TimeoutError:
+                if future.done():
+                    # The call finished after all, or raised a TimeoutError of its own,
+                    # e.g. from a nested timed call
+                    return future.result()
+                # Don't let a call the caller was told has failed start afterwards
+                if not future.cancel() and on_timeout is not None:
+                    # Already running, undo it only if it still succeeds
+                    future.add_done_callback(
+                        lambda done: done.exception() is None and on_timeout(*args, **kwargs))
+                # Extract self if method is bound
+                self_instance = args[0] if args else None
+                # Use custom error message if provided, otherwise default
+                msg = error_message(
+                    self_instance, timeout) if error_message else f"Function '{func.__name__}' exceeded timeout of {timeout} seconds."
+                raise TimeoutError(msg)
         return wrapper
     return decorator
@@ -4,9 +4,12 @@ from ..common.code_run_params import CodeRunParams
 
 
 class WorkspacePythonCodeToolbox:
+    # Command scaffolding for Python, only the code, env and argv vary per call
+    _TEMPLATE = """ sh -c '{env_vars} python3 -c "exec(__import__(\\\"base64\\\").b64decode(\\\"{base64_code}\\\").decode())" {argv}' """
+
     def get_run_command(self, code: str, params: Optional[CodeRunParams] = None) -> str:
         # Encode the provided code in base64
-        base64_code = base64.b64encode(code.encode()).decode()
+        base64_code = base64.b64encode(code.encode('utf-8')).decode('ascii')
 
         # Build environment variables string
         env_vars = ""
@@ -19,4 +22,4 @@ class WorkspacePythonCodeToolbox:
             argv = ' '.join(params.argv)
 
         # Combine everything into the final command
-        return f""" sh -c '{env_vars} python3 -c "exec(__import__(\\\"base64\\\").b64decode(\\\"{base64_code}\\\").decode())" {argv}' """
+        return self._TEMPLATE.format(base64_code=base64_code, env_vars=env_vars, argv=argv)
@@ -4,9 +4,12 @@ from ..common.code_run_params import CodeRunParams
 
 
 class WorkspaceTsCodeToolbox:
+    # Command scaffolding for TypeScript, only the code, env and argv vary per call
+    _TEMPLATE = """ sh -c 'echo {base64_code} | base64 --decode | {env_vars} npx ts-node -O "{{\\\"module\\\":\\\"CommonJS\\\"}}" -e "$(cat)" x {argv} 2>&1 | grep -vE "npm notice|npm warn exec"' """
+
     def get_run_command(self, code: str, params: Optional[CodeRunParams] = None) -> str:
         # Encode the provided code in base64
-        base64_code = base64.b64encode(code.encode()).decode()
+        base64_code = base64.b64encode(code.encode('utf-8')).decode('ascii')
 
         # Build environment variables string
         env_vars = ""
@@ -19,4 +22,4 @@ class WorkspaceTsCodeToolbox:
             argv = ' '.join(params.argv)
 
         # Combine everything into the final command for TypeScript
-        return f""" sh -c 'echo {base64_code} | base64 --decode | {env_vars} npx ts-node -O "{{\\\"module\\\":\\\"CommonJS\\\"}}" -e "$(cat)" x {argv} 2>&1 | grep -vE "npm notice|npm warn exec"' """
+        return self._TEMPLATE.format(base64_code=base64_code, env_vars=env_vars, argv=argv)
@@ -59,9 +59,12 @@ Examples:
 """
 
 from enum import Enum
-import uuid
-from typing import Optional, Dict, List, Annotated
+import secrets
+import socket
+import threading
+from typing import Optional, Dict, List, Tuple, Annotated
 from pydantic import BaseModel, Field
+from urllib3.connection import HTTPConnection
 from dataclasses import dataclass
 from environs import Env
 from daytona_api_client import (
@@ -70,6 +73,7 @@ from daytona_api_client import (
     ToolboxApi,
     ApiClient,
     CreateWorkspace,
+    Workspace as ApiWorkspace,
     SessionExecuteRequest,
     SessionExecuteResponse
 )
@@ -77,12 +81,16 @@ from daytona_sdk._utils.errors import intercept_errors, DaytonaError
 from .code_toolbox.workspace_python_code_toolbox import WorkspacePythonCodeToolbox
 from .code_toolbox.workspace_ts_code_toolbox import WorkspaceTsCodeToolbox
 from ._utils.enum import to_enum
-from .workspace import Workspace, WorkspaceTargetRegion
-from ._utils.timeout import with_timeout
+from .workspace import Workspace, WorkspaceSummary, WorkspaceTargetRegion
+from ._utils.timeout import remaining_time, with_timeout, _submit
+from ._utils.concurrency import map_concurrently
 
+# Code toolboxes are stateless, so every workspace can share the same instances
+_PY_TOOLBOX = WorkspacePythonCodeToolbox()
+_TS_TOOLBOX = WorkspaceTsCodeToolbox()
 
-@dataclass
-class CodeLanguage(Enum):
+
+class CodeLanguage(str, Enum):
     """Programming languages supported by Daytona"""
     PYTHON = "python"
     TYPESCRIPT = "typescript"
@@ -91,11 +99,6 @@ class CodeLanguage(Enum):
     def __str__(self):
         return self.value
 
-    def __eq__(self, other):
-        if isinstance(other, str):
-            return self.value == other
-        return super().__eq__(other)
-
 
 @dataclass
 class DaytonaConfig:
@@ -121,7 +124,7 @@ class DaytonaConfig:
     target: WorkspaceTargetRegion
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceResources:
     """Resources configuration for Sandbox.
 
@@ -195,6 +198,81 @@ class CreateWorkspaceParams(BaseModel):
     auto_stop_interval: Optional[int] = None
 
 
+# Keep enough idle connections for the SDK's own fan-out (16 concurrent calls by
+# default) plus the callers' threads, instead of the generated client's
+# cpu_count() * 5, which discards reusable connections on small machines
+_CONNECTION_POOL_MAXSIZE = 32
+
+# urllib3 already sets TCP_NODELAY, add keepalive probes so idle connections
+# (e.g. between LSP requests) aren't silently dropped by NATs and proxies
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+# API clients (and their connection pools) shared by all Daytona instances, keyed by (server_url, api_key)
+_API_CLIENT_CACHE: Dict[Tuple[str, str], ApiClient] = {}
+_API_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_api_client(server_url: str, api_key: str) -> ApiClient:
+    """Returns the shared API client for a server URL and API key, creating it on first use.
+
+    Args:
+        server_url (str): URL of the Daytona server.
+        api_key (str): API key for authentication with Daytona server.
+
+    Returns:
+        ApiClient: The API client for the given server URL and API key.
+    """
+    key = (server_url, api_key)
+    with _API_CLIENT_CACHE_LOCK:
+        api_client = _API_CLIENT_CACHE.get(key)
+        if api_client is None:
+            # The API key is sent as a bearer token by the client's own auth handling
+            configuration = Configuration(
+                host=server_url, access_token=api_key)
+            configuration.connection_pool_maxsize = max(
+                configuration.connection_pool_maxsize, _CONNECTION_POOL_MAXSIZE)
+            configuration.socket_options = _SOCKET_OPTIONS
+            api_client = ApiClient(configuration)
+            _API_CLIENT_CACHE[key] = api_client
+
+    return api_client
+
+
+# Whether .env and .env.local have already been read into the process environment
+_ENV_FILES_READ = False
+
+
+def _read_env_files() -> None:
+    """Reads .env and .env.local into the process environment on first call.
+
+    Later calls are no-ops, so creating additional Daytona instances doesn't
+    search for and parse the same files again.
+    """
+    global _ENV_FILES_READ
+    if _ENV_FILES_READ:
+        return
+
+    env = Env()
+    env.read_env()  # reads .env
+    # reads .env.local and overrides values
+    env.read_env(".env.local", override=True)
+    _ENV_FILES_READ = True
+
+
+def _safe_delete(workspace_api: WorkspaceApi, workspace_id: str) -> None:
+    """Force-deletes a workspace, ignoring any error.
+
+    Args:
+        workspace_api (WorkspaceApi): API client for Sandbox operations.
+        workspace_id (str): The ID of the Sandbox to delete.
+    """
+    try:
+        workspace_api.delete_workspace(workspace_id=workspace_id, force=True)
+    except Exception:
+        pass
+
+
 class Daytona:
     """Main class for interacting with Daytona Server API.
 
@@ -252,11 +330,9 @@ class Daytona:
             ```
         """
         if config is None:
-            # Initialize env - it automatically reads from .env and .env.local
+            # Initialize env - .env and .env.local are read into the environment once per process
+            _read_env_files()
             env = Env()
-            env.read_env()  # reads .env
-            # reads .env.local and overrides values
-            env.read_env(".env.local", override=True)
 
             self.api_key = env.str("DAYTONA_API_KEY")
             self.server_url = env.str("DAYTONA_SERVER_URL")
@@ -275,10 +351,7 @@ class Daytona:
         if not self.target:
             self.target = WorkspaceTargetRegion.US
 
-        # Create API configuration without api_key
-        configuration = Configuration(host=self.server_url)
-        api_client = ApiClient(configuration)
-        api_client.default_headers["Authorization"] = f"Bearer {self.api_key}"
+        api_client = _get_api_client(self.server_url, self.api_key)
 
         # Initialize API clients with the api_client instance
         self.workspace_api = WorkspaceApi(api_client)
@@ -323,21 +396,18 @@ class Daytona:
         if params is None:
             params = CreateWorkspaceParams(language="python")
 
-        params.id = params.id if params.id else f"sandbox-{str(uuid.uuid4())[:8]}"
+        params.id = params.id if params.id else f"sandbox-{secrets.token_hex(4)}"
 
         effective_timeout = params.timeout if params.timeout else timeout
 
-        try:
-            return self._create(params, effective_timeout)
-        except Exception as e:
-            try:
-                self.workspace_api.delete_workspace(
-                    workspace_id=params.id, force=True)
-            except Exception:
-                pass
-            raise e
+        return self._create(params, effective_timeout)
 
-    @with_timeout(error_message=lambda self, timeout: f"Failed to create and start workspace within {timeout} seconds timeout period.")
+    @with_timeout(
+        error_message=lambda self, timeout: f"Failed to create and start workspace within {timeout} seconds timeout period.",
+        # A timed-out creation stops at its deadline and cleans up after itself (see below),
+        # but may still succeed just before it, so delete what it created
+        on_timeout=lambda self, params, *args, **kwargs: _safe_delete(self.workspace_api, params.id),
+    )
     def _create(self, params: Optional[CreateWorkspaceParams] = None, timeout: Optional[float] = 60) -> Workspace:
         """Creates a new Sandbox and waits for it to start.
 
@@ -362,6 +432,9 @@ class Daytona:
                 "auto_stop_interval must be a non-negative integer")
 
         target = params.target if params.target else self.target
+        # The configured target may be a plain string read from the environment
+        if isinstance(target, WorkspaceTargetRegion):
+            target = target.value
 
         # Create workspace using dictionary
         workspace_data = CreateWorkspace(
@@ -372,7 +445,7 @@ class Daytona:
             env=params.env_vars if params.env_vars else {},
             labels=params.labels,
             public=params.public,
-            target=str(target) if target else None,
+            target=target if target else None,
             auto_stop_interval=params.auto_stop_interval
         )
 
@@ -382,25 +455,38 @@ class Daytona:
             workspace_data.disk = params.resources.disk
             workspace_data.gpu = params.resources.gpu
 
-        response = self.workspace_api.create_workspace(
-            create_workspace=workspace_data, _request_timeout=timeout or None)
-        workspace_info = Workspace._to_workspace_info(response)
-        response.info = workspace_info
-
-        workspace = Workspace(
-            params.id,
-            response,
-            self.workspace_api,
-            self.toolbox_api,
-            code_toolbox
-        )
-
-        # Wait for workspace to start
         try:
-            workspace.wait_for_workspace_start()
-        finally:
-            # If not Daytona SaaS, we don't need to handle pulling image state
-            pass
+            response = self.workspace_api.create_workspace(
+                create_workspace=workspace_data, _request_timeout=timeout or None)
+            workspace_info = Workspace._to_workspace_info(response)
+            response.info = workspace_info
+
+            workspace = Workspace(
+                params.id,
+                response,
+                self.workspace_api,
+                self.toolbox_api,
+                code_toolbox
+            )
+
+            # Wait for workspace to start
+            try:
+                workspace.wait_for_workspace_start()
+            finally:
+                # If not Daytona SaaS, we don't need to handle pulling image state
+                pass
+        except Exception:
+            # The creation request has completed by now, so the delete can't overtake it
+            remaining = remaining_time()
+            if remaining is not None and remaining <= 0:
+                # Timed out: the caller has its error already and this worker is joined
+                # at exit, so delete right here rather than on a thread the shutting
+                # down interpreter may no longer start
+                _safe_delete(self.workspace_api, params.id)
+            else:
+                # Clean up in the background so the error reaches the caller right away
+                _submit(_safe_delete, self.workspace_api, params.id)
+            raise
 
         return workspace
 
@@ -417,19 +503,19 @@ class Daytona:
             DaytonaError: If an unsupported language is specified.
         """
         if not params:
-            return WorkspacePythonCodeToolbox()
+            return _PY_TOOLBOX
 
-        enum_language = to_enum(CodeLanguage, params.language)
-        if enum_language is None:
-            raise DaytonaError(f"Unsupported language: {params.language}")
-        else:
+        if not isinstance(params.language, CodeLanguage):
+            enum_language = to_enum(CodeLanguage, params.language)
+            if enum_language is None:
+                raise DaytonaError(f"Unsupported language: {params.language}")
             params.language = enum_language
 
         match params.language:
             case CodeLanguage.JAVASCRIPT | CodeLanguage.TYPESCRIPT:
-                return WorkspaceTsCodeToolbox()
+                return _TS_TOOLBOX
             case CodeLanguage.PYTHON:
-                return WorkspacePythonCodeToolbox()
+                return _PY_TOOLBOX
             case _:
                 raise DaytonaError(f"Unsupported language: {params.language}")
 
@@ -453,6 +539,28 @@ class Daytona:
         """
         return self.workspace_api.delete_workspace(workspace_id=workspace.id, force=True, _request_timeout=timeout or None)
 
+    def remove_many(self, workspaces: List[Workspace], timeout: Optional[float] = 60, max_concurrency: int = 16) -> None:
+        """Removes multiple Sandboxes concurrently.
+
+        Args:
+            workspaces (List[Workspace]): The Sandbox instances to remove.
+            timeout (Optional[float]): Timeout (in seconds) for each workspace removal. 0 means no timeout. Default is 60 seconds.
+            max_concurrency (int): Maximum number of Sandboxes removed at the same time. Default is 16.
+
+        Raises:
+            DaytonaError: If any of the Sandboxes fails to remove or times out. The remaining
+                removals are still completed before the first error is raised.
+
+        Example:
+            ```python
+            workspaces = [daytona.create() for _ in range(4)]
+            # ... use workspaces ...
+            daytona.remove_many(workspaces)
+            ```
+        """
+        map_concurrently(lambda workspace: self.remove(
+            workspace, timeout), workspaces, max_concurrency)
+
     @intercept_errors(message_prefix="Failed to get workspace: ")
     def get_current_workspace(self, workspace_id: str) -> Workspace:
         """Get a Sandbox by its ID.
@@ -482,13 +590,12 @@ class Daytona:
         workspace_instance.info = workspace_info
 
         # Create and return workspace with Python code toolbox as default
-        code_toolbox = WorkspacePythonCodeToolbox()
         return Workspace(
             workspace_id,
             workspace_instance,
             self.workspace_api,
             self.toolbox_api,
-            code_toolbox
+            _PY_TOOLBOX
         )
 
     @intercept_errors(message_prefix="Failed to list workspaces: ")
@@ -507,25 +614,54 @@ class Daytona:
         """
         workspaces = self.workspace_api.list_workspaces()
 
-        for workspace in workspaces:
-            workspace_info = Workspace._to_workspace_info(workspace)
-            workspace.info = workspace_info
+        return [self._hydrate_workspace(workspace) for workspace in workspaces]
+
+    @intercept_errors(message_prefix="Failed to list workspaces: ")
+    def list_summaries(self) -> List[WorkspaceSummary]:
+        """Lists all Sandboxes without building full Sandbox instances.
+
+        Use `list_summaries()` for enumeration and `get_current_workspace()` to
+        get a full Sandbox instance for the ones you need.
 
+        Returns:
+            List[WorkspaceSummary]: Summaries of all available Sandboxes.
+
+        Example:
+            ```python
+            summaries = daytona.list_summaries()
+            for summary in summaries:
+                print(f"{summary.id}: {summary.state}")
+            workspace = daytona.get_current_workspace(summaries[0].id)
+            ```
+        """
         return [
-            Workspace(
-                workspace.id,
-                workspace,
-                self.workspace_api,
-                self.toolbox_api,
-                self._get_code_toolbox(
-                    CreateWorkspaceParams(
-                        language=self._validate_language_label(
-                            workspace.labels.get("code-toolbox-language"))
-                    )
+            Workspace._to_workspace_summary(workspace)
+            for workspace in self.workspace_api.list_workspaces()
+        ]
+
+    def _hydrate_workspace(self, workspace: ApiWorkspace) -> Workspace:
+        """Builds a Workspace from a workspace returned by the API.
+
+        Args:
+            workspace (ApiWorkspace): The API workspace instance to wrap.
+
+        Returns:
+            Workspace: The Sandbox instance.
+        """
+        workspace.info = Workspace._to_workspace_info(workspace)
+
+        return Workspace(
+            workspace.id,
+            workspace,
+            self.workspace_api,
+            self.toolbox_api,
+            self._get_code_toolbox(
+                CreateWorkspaceParams(
+                    language=self._validate_language_label(
+                        workspace.labels.get("code-toolbox-language"))
                 )
             )
-            for workspace in workspaces
-        ]
+        )
 
     def _validate_language_label(self, language: Optional[str]) -> CodeLanguage:
         """Validates and normalizes the language label.
@@ -581,6 +717,36 @@ class Daytona:
         """
         workspace.stop(timeout)
 
+    def start_many(self, workspaces: List[Workspace], timeout: Optional[float] = 60, max_concurrency: int = 16) -> None:
+        """Starts multiple Sandboxes concurrently and waits for them to be ready.
+
+        Args:
+            workspaces (List[Workspace]): The Sandboxes to start.
+            timeout (Optional[float]): Optional timeout in seconds to wait for each Sandbox to start. 0 means no timeout. Default is 60 seconds.
+            max_concurrency (int): Maximum number of Sandboxes started at the same time. Default is 16.
+
+        Raises:
+            DaytonaError: If timeout is negative; If any of the Sandboxes fails to start or times out.
+                The remaining starts are still completed before the first error is raised.
+        """
+        map_concurrently(lambda workspace: self.start(
+            workspace, timeout), workspaces, max_concurrency)
+
+    def stop_many(self, workspaces: List[Workspace], timeout: Optional[float] = 60, max_concurrency: int = 16) -> None:
+        """Stops multiple Sandboxes concurrently and waits for them to be stopped.
+
+        Args:
+            workspaces (List[Workspace]): The Sandboxes to stop.
+            timeout (Optional[float]): Optional timeout (in seconds) for each workspace stop. 0 means no timeout. Default is 60 seconds.
+            max_concurrency (int): Maximum number of Sandboxes stopped at the same time. Default is 16.
+
+        Raises:
+            DaytonaError: If timeout is negative; If any of the Sandboxes fails to stop or times out.
+                The remaining stops are still completed before the first error is raised.
+        """
+        map_concurrently(lambda workspace: self.stop(
+            workspace, timeout), workspaces, max_concurrency)
+
 
 # Export these at module level
 __all__ = [
@@ -590,5 +756,7 @@ __all__ = [
     "CodeLanguage",
     "Workspace",
     "SessionExecuteRequest",
-    "SessionExecuteResponse"
+    "SessionExecuteResponse",
+    "DaytonaError",
+    "WorkspaceTargetRegion"
 ]
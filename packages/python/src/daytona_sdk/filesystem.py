@@ -11,10 +11,9 @@ Examples:
     # Create a directory
     workspace.fs.create_folder("/workspace/data", "755")
     
-    # Upload a file
+    # Upload a file, streaming it from disk
     with open("local_file.txt", "rb") as f:
-        content = f.read()
-    workspace.fs.upload_file("/workspace/data/file.txt", content)
+        workspace.fs.upload_file_stream("/workspace/data/file.txt", f)
     
     # List directory contents
     files = workspace.fs.list_files("/workspace")
@@ -64,7 +63,14 @@ Note:
     stated otherwise.
 """
 
-from typing import List
+import asyncio
+import codecs
+import functools
+import io
+import json
+import posixpath
+from typing import BinaryIO, Dict, Iterator, List, Optional, TypeVar
+from urllib3.filepost import choose_boundary
 from daytona_api_client import (
     FileInfo,
     Match,
@@ -73,9 +79,28 @@ from daytona_api_client import (
     SearchFilesResponse,
     ToolboxApi,
 )
-from daytona_sdk._utils.errors import intercept_errors
+from daytona_api_client.exceptions import NotFoundException
+from daytona_api_client.rest import RESTResponse
+from daytona_sdk._utils.errors import intercept_errors, to_daytona_error
+from daytona_sdk._utils.concurrency import map_concurrently, run_in_thread
+from daytona_sdk._utils.cache import TTLCache
 from .protocols import WorkspaceInstance
 
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional, see the `zstd` extra
+    zstandard = None
+
+T = TypeVar('T')
+
+# Size of the chunks file contents are transferred in when streaming
+_STREAM_CHUNK_SIZE = 128 * 1024
+# Maximum number of files sent in a single replace request
+_REPLACE_BATCH_SIZE = 8
+# Uploads smaller than this gain too little from compression to be worth it
+_COMPRESS_MIN_SIZE = 4096
+_COMPRESS_LEVEL = 3
+
 
 class FileSystem:
     """Provides file system operations within a Sandbox.
@@ -85,19 +110,85 @@ class FileSystem:
     creating, deleting, and moving files, as well as searching file contents and
     managing permissions.
 
+    File metadata returned by get_file_info() and list_files() is cached for a
+    few seconds, including paths that were not found and, after a directory was
+    listed, paths missing from the listing. Any mutating call made
+    through this instance invalidates the affected entries; changes made by
+    other means (e.g. shell commands) may be observed only after the cache expires.
+
+    Requests go through the API client's connection pool, which is shared by all
+    Sandboxes using the same client and keeps connections alive between calls.
+    The file system can be used as a context manager to drop its caches when done.
+
     Attributes:
         instance (WorkspaceInstance): The Sandbox instance this file system belongs to.
+
+    Example:
+        ```python
+        with daytona.create().fs as fs:
+            fs.upload_file("/workspace/data/file.txt", b"Hello, World!")
+            info = fs.get_file_info("/workspace/data/file.txt")
+        ```
     """
 
-    def __init__(self, instance: WorkspaceInstance, toolbox_api: ToolboxApi):
+    __slots__ = (
+        "instance",
+        "toolbox_api",
+        "_api_get_file_info",
+        "_api_list_files",
+        "_api_find_in_files",
+        "_stat_cache",
+        "_negative_cache",
+        "_listing_cache",
+        "_compressed_uploads",
+    )
+
+    def __init__(
+        self,
+        instance: WorkspaceInstance,
+        toolbox_api: ToolboxApi,
+        stat_cache_size: int = 1024,
+        stat_cache_ttl: float = 5.0,
+    ):
         """Initializes a new FileSystem instance.
 
         Args:
             instance (WorkspaceInstance): The Sandbox instance this file system belongs to.
             toolbox_api (ToolboxApi): API client for Sandbox operations.
+            stat_cache_size (int): Maximum number of cached file metadata entries. 0 disables caching.
+            stat_cache_ttl (float): Number of seconds cached file metadata stays valid.
         """
         self.instance = instance
         self.toolbox_api = toolbox_api
+        # Toolbox calls made most often, with the Sandbox ID bound up front
+        self._api_get_file_info = functools.partial(toolbox_api.get_file_info, workspace_id=instance.id)
+        self._api_list_files = functools.partial(toolbox_api.list_files, workspace_id=instance.id)
+        self._api_find_in_files = functools.partial(
+            toolbox_api.find_in_files_without_preload_content, workspace_id=instance.id)
+        # Path -> FileInfo for paths that exist, and path -> (status, reason, body)
+        # of the 404 for paths that don't
+        self._stat_cache = TTLCache(stat_cache_size, stat_cache_ttl)
+        self._negative_cache = TTLCache(stat_cache_size, stat_cache_ttl)
+        # Directory -> names of its children, as of the last list_files() call
+        self._listing_cache = TTLCache(stat_cache_size, stat_cache_ttl)
+        # Cleared once the toolbox rejects a compressed upload, so it isn't retried
+        self._compressed_uploads = zstandard is not None
+
+    def close(self) -> None:
+        """Drops the cached file metadata held by this instance.
+
+        The underlying connections belong to the shared API client and are left open
+        for reuse, so the file system can still be used afterwards.
+        """
+        self._stat_cache.clear()
+        self._negative_cache.clear()
+        self._listing_cache.clear()
+
+    def __enter__(self) -> "FileSystem":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     @intercept_errors(message_prefix="Failed to create folder: ")
     def create_folder(self, path: str, mode: str) -> None:
@@ -119,9 +210,12 @@ class FileSystem:
             workspace.fs.create_folder("/workspace/secrets", "700")
             ```
         """
-        self.toolbox_api.create_folder(
-            workspace_id=self.instance.id, path=path, mode=mode
-        )
+        try:
+            self.toolbox_api.create_folder(
+                workspace_id=self.instance.id, path=path, mode=mode
+            )
+        finally:
+            self._invalidate(path)
 
     @intercept_errors(message_prefix="Failed to delete file: ")
     def delete_file(self, path: str) -> None:
@@ -138,9 +232,68 @@ class FileSystem:
             workspace.fs.delete_file("/workspace/data/old_file.txt")
             ```
         """
-        self.toolbox_api.delete_file(
-            workspace_id=self.instance.id, path=path
-        )
+        try:
+            self.toolbox_api.delete_file(
+                workspace_id=self.instance.id, path=path
+            )
+        finally:
+            self._invalidate(path)
+
+    @intercept_errors(message_prefix="Failed to delete files: ")
+    def delete_files_batch(self, paths: List[str], max_workers: int = 16) -> None:
+        """Deletes multiple files from the Sandbox.
+
+        The deletions are issued concurrently, so deleting many files takes about
+        as long as the slowest single deletion rather than the sum of all of them.
+
+        Args:
+            paths (List[str]): Absolute paths to the files to delete.
+            max_workers (int): Maximum number of deletions in flight at the same time.
+
+        Example:
+            ```python
+            workspace.fs.delete_files_batch([
+                "/workspace/data/old_1.txt",
+                "/workspace/data/old_2.txt"
+            ])
+            ```
+        """
+        try:
+            map_concurrently(
+                lambda path: self.toolbox_api.delete_file(
+                    workspace_id=self.instance.id, path=path
+                ),
+                paths,
+                max_workers,
+            )
+        finally:
+            self._invalidate(*paths)
+
+    @intercept_errors(message_prefix="Failed to check if files exist: ")
+    def exists_batch(self, paths: List[str], max_workers: int = 16) -> Dict[str, bool]:
+        """Checks whether multiple files or directories exist in the Sandbox.
+
+        Args:
+            paths (List[str]): Absolute paths to check.
+            max_workers (int): Maximum number of requests in flight at the same time.
+
+        Returns:
+            Dict[str, bool]: Whether each of the given paths exists, keyed by path.
+
+        Example:
+            ```python
+            exists = workspace.fs.exists_batch(["/workspace/a.txt", "/workspace/b.txt"])
+            missing = [path for path, found in exists.items() if not found]
+            ```
+        """
+        def exists(path: str) -> bool:
+            try:
+                self._get_file_info(path)
+            except NotFoundException:
+                return False
+            return True
+
+        return dict(zip(paths, map_concurrently(exists, paths, max_workers)))
 
     @intercept_errors(message_prefix="Failed to download file: ")
     def download_file(self, path: str) -> bytes:
@@ -166,11 +319,37 @@ class FileSystem:
             config = json.loads(content.decode('utf-8'))
             ```
         """
-        return self.toolbox_api.download_file(
-            workspace_id=self.instance.id, path=path
-        )
+        return b"".join(self._download_file_stream(path, _STREAM_CHUNK_SIZE))
+
+    def download_file_stream(self, path: str, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """Downloads a file from the Sandbox in chunks.
+
+        Unlike download_file(), the file contents are never held in memory as a
+        whole, so this is suited for large files. The response is read as the
+        returned iterator is consumed.
+
+        Args:
+            path (str): Absolute path to the file to download.
+            chunk_size (int): Maximum size of each chunk in bytes.
+
+        Returns:
+            Iterator[bytes]: The file contents, chunk by chunk.
+
+        Example:
+            ```python
+            # Download a large file to disk
+            with open("local_copy.tar.gz", "wb") as f:
+                for chunk in workspace.fs.download_file_stream("/workspace/backup.tar.gz"):
+                    f.write(chunk)
+            ```
+        """
+        try:
+            chunks = self._download_file_stream(path, chunk_size)
+        except Exception as e:
+            raise to_daytona_error(e, "Failed to download file: ")
+        # Reading the body can fail too, e.g. when the connection drops midway
+        return _convert_errors(chunks, "Failed to download file: ")
 
-    @intercept_errors(message_prefix="Failed to find files: ")
     def find_files(self, path: str, pattern: str) -> List[Match]:
         """Searches for files containing a pattern.
 
@@ -195,11 +374,36 @@ class FileSystem:
                 print(f"{match.file}:{match.line}: {match.content.strip()}")
             ```
         """
-        return self.toolbox_api.find_in_files(
-            workspace_id=self.instance.id, path=path, pattern=pattern
-        )
+        try:
+            return list(self._find_files_iter(path, pattern))
+        except Exception as e:
+            raise to_daytona_error(e, "Failed to find files: ")
+
+    def find_files_iter(self, path: str, pattern: str) -> Iterator[Match]:
+        """Searches for files containing a pattern, yielding matches as they arrive.
+
+        Unlike find_files(), the matches are parsed from the response while it is
+        being received, so the first ones are available early and the whole
+        result never has to be held in memory.
+
+        Args:
+            path (str): Absolute path to the file or directory to search. If the path is a directory, the search will be performed recursively.
+            pattern (str): Search pattern to match against file contents.
+
+        Returns:
+            Iterator[Match]: Matches found in files, see find_files().
+
+        Example:
+            ```python
+            # Stop at the first match
+            match = next(workspace.fs.find_files_iter("/workspace/src", "TODO:"), None)
+            ```
+        """
+        try:
+            yield from self._find_files_iter(path, pattern)
+        except Exception as e:
+            raise to_daytona_error(e, "Failed to find files: ")
 
-    @intercept_errors(message_prefix="Failed to get file info: ")
     def get_file_info(self, path: str) -> FileInfo:
         """Gets detailed information about a file.
 
@@ -234,11 +438,36 @@ class FileSystem:
                 print("Path is a directory")
             ```
         """
-        return self.toolbox_api.get_file_info(
-            workspace_id=self.instance.id, path=path
-        )
+        try:
+            return self._get_file_info(path)
+        except Exception as e:
+            raise to_daytona_error(e, "Failed to get file info: ")
+
+    @intercept_errors(message_prefix="Failed to get file info: ")
+    def get_file_info_batch(self, paths: List[str], max_workers: int = 16) -> Dict[str, FileInfo]:
+        """Gets detailed information about multiple files.
+
+        The requests are issued concurrently, so this is much faster than calling
+        get_file_info() for each path in a loop.
+
+        Args:
+            paths (List[str]): Absolute paths to the files or directories.
+            max_workers (int): Maximum number of requests in flight at the same time.
+
+        Returns:
+            Dict[str, FileInfo]: File information for each of the given paths, keyed by path.
+                Each FileInfo includes the same fields as described in get_file_info().
+
+        Example:
+            ```python
+            paths = ["/workspace/data/a.txt", "/workspace/data/b.txt"]
+            infos = workspace.fs.get_file_info_batch(paths)
+            for path, info in infos.items():
+                print(f"{path}: {info.size} bytes")
+            ```
+        """
+        return dict(zip(paths, map_concurrently(self._get_file_info, paths, max_workers)))
 
-    @intercept_errors(message_prefix="Failed to list files: ")
     def list_files(self, path: str) -> List[FileInfo]:
         """Lists files and directories in a given path.
 
@@ -267,9 +496,20 @@ class FileSystem:
             print("Subdirectories:", ", ".join(d.name for d in dirs))
             ```
         """
-        return self.toolbox_api.list_files(
-            workspace_id=self.instance.id, path=path
-        )
+        try:
+            files = self._api_list_files(path=path)
+        except Exception as e:
+            raise to_daytona_error(e, "Failed to list files: ")
+
+        # Prime the metadata cache so get_file_info() on the children is a local hit
+        for file in files:
+            child = posixpath.join(path, file.name)
+            self._stat_cache.set(_cache_key(child), file)
+            self._negative_cache.delete(_cache_key(child))
+        # ...and so a lookup of a child that wasn't listed fails without a request
+        self._listing_cache.set(_cache_key(path), frozenset(file.name for file in files))
+
+        return files
 
     @intercept_errors(message_prefix="Failed to move files: ")
     def move_files(self, source: str, destination: str) -> None:
@@ -303,24 +543,64 @@ class FileSystem:
             )
             ```
         """
-        self.toolbox_api.move_file(
-            workspace_id=self.instance.id,
-            source=source,
-            destination=destination,
-        )
+        try:
+            self.toolbox_api.move_file(
+                workspace_id=self.instance.id,
+                source=source,
+                destination=destination,
+            )
+        finally:
+            self._invalidate(source, destination)
+
+    @intercept_errors(message_prefix="Failed to prefetch file info: ")
+    def prefetch_metadata(self, paths: List[str], max_workers: int = 16) -> None:
+        """Fetches information about multiple files into the metadata cache.
+
+        Call this before a loop over many files to overlap the requests: they are
+        issued concurrently, and the get_file_info() calls that follow are answered
+        from the cache as long as it has not expired. Paths that don't exist are
+        cached as missing and don't cause an error here.
+
+        Args:
+            paths (List[str]): Absolute paths to the files or directories.
+            max_workers (int): Maximum number of requests in flight at the same time.
+
+        Example:
+            ```python
+            paths = [f"/workspace/data/{i}.json" for i in range(500)]
+            workspace.fs.prefetch_metadata(paths)
+            for path in paths:
+                info = workspace.fs.get_file_info(path)  # No request
+            ```
+        """
+        def prefetch(path: str) -> None:
+            try:
+                self._get_file_info(path)
+            except NotFoundException:
+                pass
+
+        map_concurrently(prefetch, paths, max_workers)
 
     @intercept_errors(message_prefix="Failed to replace in files: ")
     def replace_in_files(
-        self, files: List[str], pattern: str, new_value: str
+        self,
+        files: List[str],
+        pattern: str,
+        new_value: str,
+        max_workers: Optional[int] = None,
     ) -> List[ReplaceResult]:
         """Replaces text in multiple files.
 
         This method performs search and replace operations across multiple files.
+        The files are split into batches of up to 8 that are sent as concurrent
+        requests, so large file lists aren't processed one after another.
 
         Args:
             files (List[str]): List of absolute file paths to perform replacements in.
             pattern (str): Pattern to search for.
             new_value (str): Text to replace matches with.
+            max_workers (Optional[int]): Maximum number of batches in flight at the same
+                time. Defaults to `min(8, len(files))`.
 
         Returns:
             List[ReplaceResult]: List of results indicating replacements made in
@@ -346,13 +626,27 @@ class FileSystem:
                     print(f"{result.file}: {result.error}")
             ```
         """
-        replace_request = ReplaceRequest(
-            files=files, new_value=new_value, pattern=pattern
-        )
+        if max_workers is None:
+            max_workers = min(_REPLACE_BATCH_SIZE, len(files))
+        batches = [
+            files[i:i + _REPLACE_BATCH_SIZE]
+            for i in range(0, len(files), _REPLACE_BATCH_SIZE)
+        ]
+
+        def replace_batch(batch: List[str]) -> List[ReplaceResult]:
+            # Built without validation, which would otherwise check every path again
+            replace_request = ReplaceRequest.model_construct(
+                files=batch, new_value=new_value, pattern=pattern
+            )
+            return self.toolbox_api.replace_in_files(
+                workspace_id=self.instance.id, replace_request=replace_request
+            )
 
-        return self.toolbox_api.replace_in_files(
-            workspace_id=self.instance.id, replace_request=replace_request
-        )
+        try:
+            results = map_concurrently(replace_batch, batches, max_workers)
+        finally:
+            self._invalidate(*files)
+        return [result for batch_results in results for result in batch_results]
 
     @intercept_errors(message_prefix="Failed to search files: ")
     def search_files(self, path: str, pattern: str) -> SearchFilesResponse:
@@ -419,16 +713,19 @@ class FileSystem:
             )
             ```
         """
-        self.toolbox_api.set_file_permissions(
-            workspace_id=self.instance.id,
-            path=path,
-            mode=mode,
-            owner=owner,
-            group=group,
-        )
+        try:
+            self.toolbox_api.set_file_permissions(
+                workspace_id=self.instance.id,
+                path=path,
+                mode=mode,
+                owner=owner,
+                group=group,
+            )
+        finally:
+            self._invalidate(path)
 
     @intercept_errors(message_prefix="Failed to upload file: ")
-    def upload_file(self, path: str, file: bytes) -> None:
+    def upload_file(self, path: str, file: bytes, compress: bool = False) -> None:
         """Uploads a file to the Sandbox.
 
         This method uploads a file to the specified path in the Sandbox. The
@@ -438,6 +735,11 @@ class FileSystem:
         Args:
             path (str): Absolute destination path in the Sandbox.
             file (bytes): File contents as a bytes object.
+            compress (bool): Whether to send the contents zstd-compressed. Off by default, only
+                enable it for toolboxes known to accept zstd request bodies. Only takes effect
+                when the `zstandard` package is installed (`pip install daytona_sdk[zstd]`)
+                and the file is larger than 4 KiB. If the toolbox rejects the compressed
+                request, the file is sent again uncompressed.
 
         Example:
             ```python
@@ -457,6 +759,426 @@ class FileSystem:
             workspace.fs.upload_file("/workspace/data/config.json", content)
             ```
         """
-        self.toolbox_api.upload_file(
-            workspace_id=self.instance.id, path=path, file=file
+        try:
+            if (
+                compress
+                and self._compressed_uploads
+                and len(file) > _COMPRESS_MIN_SIZE
+                and self._upload_file_compressed(path, file)
+            ):
+                return
+            self.toolbox_api.upload_file(
+                workspace_id=self.instance.id, path=path, file=file
+            )
+        finally:
+            self._invalidate(path)
+
+    @intercept_errors(message_prefix="Failed to upload file: ")
+    def upload_file_stream(self, path: str, fp: BinaryIO, chunk_size: int = _STREAM_CHUNK_SIZE) -> None:
+        """Uploads a file to the Sandbox from a file-like object.
+
+        Unlike upload_file(), the contents are read from `fp` and sent in chunks
+        using a chunked request, so they never have to fit in memory as a whole.
+        The parent directory must exist. If a file already exists at the
+        destination path, it will be overwritten.
+
+        Args:
+            path (str): Absolute destination path in the Sandbox.
+            fp (BinaryIO): File-like object opened in binary mode to read the contents from.
+            chunk_size (int): Maximum number of bytes read from `fp` at a time.
+
+        Example:
+            ```python
+            # Upload a large local file
+            with open("dataset.csv", "rb") as f:
+                workspace.fs.upload_file_stream("/workspace/data/dataset.csv", f)
+            ```
+        """
+        try:
+            boundary = choose_boundary()
+            response = self._send_upload(
+                path, boundary, _multipart_body(boundary, fp, chunk_size), chunked=True
+            )
+            try:
+                self._raise_for_status(response)
+            finally:
+                response.drain_conn()
+                response.release_conn()
+        finally:
+            self._invalidate(path)
+
+    def _upload_file_compressed(self, path: str, file: bytes) -> bool:
+        """Uploads a file with a zstd-compressed request body.
+
+        Args:
+            path (str): Absolute destination path in the Sandbox.
+            file (bytes): File contents as a bytes object.
+
+        Returns:
+            bool: True if the file was uploaded, False if the toolbox rejected the
+                compressed request and the file has to be sent uncompressed.
+        """
+        boundary = choose_boundary()
+        body = b"".join(_multipart_body(boundary, io.BytesIO(file), len(file)))
+        response = self._send_upload(
+            path,
+            boundary,
+            zstandard.ZstdCompressor(level=_COMPRESS_LEVEL).compress(body),
+            chunked=False,
+            headers={"Content-Encoding": "zstd"},
+        )
+        try:
+            if 400 <= response.status <= 499:
+                # A toolbox that can't decode the body typically fails to parse the
+                # form (400) rather than answering 415; any client error gets a plain
+                # retry, which also reports the real error if the upload is invalid
+                if response.status in (400, 415):
+                    self._compressed_uploads = False
+                return False
+            self._raise_for_status(response)
+            return True
+        finally:
+            # Unread error bodies would be read by the retry as part of its response
+            response.drain_conn()
+            response.release_conn()
+
+    def _send_upload(
+        self,
+        path: str,
+        boundary: str,
+        body,
+        chunked: bool,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """Sends a hand-built multipart upload request to the toolbox.
+
+        The URL and auth headers are produced by the generated client, only the
+        body (and its content type) is supplied by the caller.
+
+        Args:
+            path (str): Absolute destination path in the Sandbox.
+            boundary (str): Multipart boundary used in the body.
+            body: The request body, as bytes or an iterator of bytes.
+            chunked (bool): Whether to send the body with chunked transfer encoding.
+            headers (Optional[Dict[str, str]]): Additional request headers.
+
+        Returns:
+            The urllib3 response, with its content not yet read.
+        """
+        method, url, request_headers, _, _ = self.toolbox_api._upload_file_serialize(
+            workspace_id=self.instance.id,
+            path=path,
+            file=None,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        request_headers["Content-Type"] = f"multipart/form-data; boundary={boundary}"
+        if headers:
+            request_headers.update(headers)
+
+        return self.toolbox_api.api_client.rest_client.pool_manager.request(
+            method,
+            url,
+            body=body,
+            headers=request_headers,
+            chunked=chunked,
+            preload_content=False,
+        )
+
+    def _find_files_iter(self, path: str, pattern: str) -> Iterator[Match]:
+        """Starts a content search and returns an iterator over its matches. See find_files_iter()."""
+        response = self._api_find_in_files(path=path, pattern=pattern)
+        self._raise_for_status(response)
+        chunks = _iter_chunks(response, _STREAM_CHUNK_SIZE)
+        try:
+            for item in _iter_json_array(chunks):
+                yield Match.from_dict(item)
+            # Read past the end of the array, so the connection can be reused
+            for _ in chunks:
+                pass
+        finally:
+            # Closes the response if the caller stopped early, see _iter_chunks()
+            chunks.close()
+
+    def _download_file_stream(self, path: str, chunk_size: int) -> Iterator[bytes]:
+        """Starts a file download and returns an iterator over its body. See download_file_stream()."""
+        response = self.toolbox_api.download_file_without_preload_content(
+            workspace_id=self.instance.id,
+            path=path,
+            # A fresh dict each time, the generated client adds to it
+            _headers={"Accept-Encoding": "zstd"} if zstandard is not None else None,
         )
+        self._raise_for_status(response)
+        return _iter_chunks(response, chunk_size)
+
+    def _raise_for_status(self, response) -> None:
+        """Raises the API client's exception for an unsuccessful raw response.
+
+        Args:
+            response: An urllib3 response whose content was not preloaded.
+
+        Raises:
+            ApiException: If the response status is not 2xx.
+        """
+        if 200 <= response.status <= 299:
+            return
+        rest_response = RESTResponse(response)
+        rest_response.read()
+        self.toolbox_api.api_client.response_deserialize(rest_response, {})
+
+    def _get_file_info(self, path: str) -> FileInfo:
+        """Gets file information, consulting the metadata cache first.
+
+        Args:
+            path (str): Absolute path to the file or directory.
+
+        Returns:
+            FileInfo: Detailed file information.
+
+        Raises:
+            NotFoundException: If the path does not exist.
+        """
+        key = _cache_key(path)
+
+        info = self._stat_cache.get(key)
+        if info is not None:
+            return info
+
+        missing = self._negative_cache.get(key)
+        if missing is not None:
+            # A fresh exception each time, re-raising one shared instance would keep
+            # growing its traceback, from every thread that hits the entry
+            status, reason, body = missing
+            raise NotFoundException(status=status, reason=reason, body=body)
+
+        parent = posixpath.dirname(key)
+        if parent != key:
+            names = self._listing_cache.get(parent)
+            if names is not None and posixpath.basename(key) not in names:
+                raise NotFoundException(status=404, reason="Not Found", body=f"File not found: {path}")
+
+        try:
+            info = self._api_get_file_info(path=path)
+        except NotFoundException as e:
+            self._negative_cache.set(key, (e.status, e.reason, e.body))
+            raise
+
+        self._stat_cache.set(key, info)
+        return info
+
+    def _invalidate(self, *paths: str) -> None:
+        """Drops cached metadata for paths, everything below them and their parent directories.
+
+        Args:
+            *paths (str): Paths that were changed.
+        """
+        if not paths:
+            return
+
+        # Collected up front so each cache is scanned once, however many paths changed
+        exact = set()
+        prefixes = set()
+        for path in paths:
+            key = _cache_key(path)
+            exact.add(key)
+            exact.add(posixpath.dirname(key))
+            prefixes.add(key.rstrip("/") + "/")
+        prefixes = tuple(prefixes)
+
+        def is_stale(cached: str) -> bool:
+            return cached in exact or cached.startswith(prefixes)
+
+        for cache in (self._stat_cache, self._negative_cache, self._listing_cache):
+            cache.delete_where(is_stale)
+
+
+class AsyncFileSystem:
+    """Provides file system operations within a Sandbox for asyncio code.
+
+    Wraps a FileSystem and runs its blocking calls on worker threads, so many
+    operations can be awaited concurrently from one event loop. The number of
+    calls in flight is capped, since more threads stop helping past a point.
+
+    Attributes:
+        fs (FileSystem): The wrapped file system.
+
+    Example:
+        ```python
+        fs = AsyncFileSystem(workspace.fs)
+
+        # Download several files concurrently
+        contents = await fs.download_files([
+            "/workspace/data/a.txt",
+            "/workspace/data/b.txt"
+        ])
+        ```
+    """
+
+    def __init__(self, fs: FileSystem, max_concurrency: int = 16):
+        """Initializes a new AsyncFileSystem instance.
+
+        Args:
+            fs (FileSystem): The file system to wrap, e.g. `workspace.fs`.
+            max_concurrency (int): Maximum number of operations running at the same time.
+        """
+        self.fs = fs
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def create_folder(self, path: str, mode: str) -> None:
+        """Creates a new directory in the Sandbox. See FileSystem.create_folder()."""
+        await run_in_thread(self._semaphore, self.fs.create_folder, path, mode)
+
+    async def delete_file(self, path: str) -> None:
+        """Deletes a file from the Sandbox. See FileSystem.delete_file()."""
+        await run_in_thread(self._semaphore, self.fs.delete_file, path)
+
+    async def download_file(self, path: str) -> bytes:
+        """Downloads a file from the Sandbox. See FileSystem.download_file()."""
+        return await run_in_thread(self._semaphore, self.fs.download_file, path)
+
+    async def download_files(self, paths: List[str]) -> List[bytes]:
+        """Downloads multiple files from the Sandbox concurrently.
+
+        Args:
+            paths (List[str]): Absolute paths to the files to download.
+
+        Returns:
+            List[bytes]: The file contents, in the same order as the paths.
+        """
+        return await asyncio.gather(*(self.download_file(path) for path in paths))
+
+    async def find_files(self, path: str, pattern: str) -> List[Match]:
+        """Searches for files containing a pattern. See FileSystem.find_files()."""
+        return await run_in_thread(self._semaphore, self.fs.find_files, path, pattern)
+
+    async def get_file_info(self, path: str) -> FileInfo:
+        """Gets detailed information about a file. See FileSystem.get_file_info()."""
+        return await run_in_thread(self._semaphore, self.fs.get_file_info, path)
+
+    async def list_files(self, path: str) -> List[FileInfo]:
+        """Lists files and directories in a given path. See FileSystem.list_files()."""
+        return await run_in_thread(self._semaphore, self.fs.list_files, path)
+
+    async def move_files(self, source: str, destination: str) -> None:
+        """Moves files from one location to another. See FileSystem.move_files()."""
+        await run_in_thread(self._semaphore, self.fs.move_files, source, destination)
+
+    async def replace_in_files(
+        self, files: List[str], pattern: str, new_value: str
+    ) -> List[ReplaceResult]:
+        """Replaces text in multiple files. See FileSystem.replace_in_files()."""
+        return await run_in_thread(self._semaphore, self.fs.replace_in_files, files, pattern, new_value)
+
+    async def search_files(self, path: str, pattern: str) -> SearchFilesResponse:
+        """Searches for files and directories matching a pattern in their names. See FileSystem.search_files()."""
+        return await run_in_thread(self._semaphore, self.fs.search_files, path, pattern)
+
+    async def set_file_permissions(
+        self, path: str, mode: str = None, owner: str = None, group: str = None
+    ) -> None:
+        """Sets permissions and ownership for a file or directory. See FileSystem.set_file_permissions()."""
+        await run_in_thread(self._semaphore, self.fs.set_file_permissions, path, mode, owner, group)
+
+    async def upload_file(self, path: str, file: bytes, compress: bool = False) -> None:
+        """Uploads a file to the Sandbox. See FileSystem.upload_file()."""
+        await run_in_thread(self._semaphore, self.fs.upload_file, path, file, compress)
+
+
+def _iter_chunks(response, chunk_size: int) -> Iterator[bytes]:
+    """Yields the body of a raw response in chunks, releasing the connection when done.
+
+    The connection only goes back to the pool once the body has been read in full.
+    If iteration stops early it is closed instead, since the next request sent on it
+    would otherwise read the rest of this body as its response.
+    """
+    complete = False
+    try:
+        if zstandard is not None and response.headers.get("Content-Encoding") == "zstd":
+            # Decoded here since urllib3 only handles zstd with other backends
+            decompressor = zstandard.ZstdDecompressor().decompressobj()
+            for chunk in response.stream(chunk_size, decode_content=False):
+                data = decompressor.decompress(chunk)
+                if data:
+                    yield data
+        else:
+            yield from response.stream(chunk_size)
+        complete = True
+    finally:
+        if complete:
+            response.drain_conn()
+        else:
+            response.close()
+        response.release_conn()
+
+
+def _convert_errors(items: Iterator[T], message_prefix: str) -> Iterator[T]:
+    """Yields from an iterator, converting its errors like intercept_errors does for calls."""
+    try:
+        yield from items
+    except Exception as e:
+        raise to_daytona_error(e, message_prefix)
+
+
+def _iter_json_array(chunks: Iterator[bytes]) -> Iterator[object]:
+    """Yields the elements of a JSON array as its encoded text arrives in chunks.
+
+    A `null` document is treated as an empty array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    index = 0
+    started = False
+
+    for chunk in chunks:
+        buffer = buffer[index:] + text_decoder.decode(chunk)
+        index = 0
+        while True:
+            # Skip whitespace and the separators between elements
+            while index < len(buffer) and buffer[index] in " \t\r\n,":
+                index += 1
+            if index == len(buffer):
+                break
+            if not started:
+                if buffer[index] != "[":
+                    if buffer.startswith("null", index):
+                        return
+                    if len(buffer) - index < 4 and "null".startswith(buffer[index:]):
+                        break
+                    raise ValueError(f"Expected a JSON array, got {buffer[index:index + 20]!r}")
+                started = True
+                index += 1
+                continue
+            if buffer[index] == "]":
+                return
+            try:
+                item, index = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                # The element isn't complete yet, wait for more data
+                break
+            yield item
+
+    if started or buffer[index:].strip():
+        raise ValueError("Incomplete JSON array in response")
+
+
+def _multipart_body(boundary: str, fp: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Yields a multipart/form-data body holding the contents of `fp` as its `file` field."""
+    yield (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="file"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode("ascii")
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+    yield f"\r\n--{boundary}--\r\n".encode("ascii")
+
+
+def _cache_key(path: str) -> str:
+    """Normalizes a path so equivalent spellings share one cache entry."""
+    return posixpath.normpath(path)
@@ -40,6 +40,7 @@ Note:
     stated otherwise.
 """
 
+import asyncio
 from typing import List, Optional, TYPE_CHECKING
 from daytona_api_client import (
     GitStatus,
@@ -50,6 +51,7 @@ from daytona_api_client import (
     GitCommitRequest,
     GitRepoRequest,
 )
+from daytona_sdk._utils.concurrency import run_in_thread
 from daytona_sdk._utils.errors import intercept_errors
 from .protocols import WorkspaceInstance
 
@@ -92,6 +94,8 @@ class Git:
         ```
     """
 
+    __slots__ = ("workspace", "toolbox_api", "instance")
+
     def __init__(
         self,
         workspace: "Workspace",
@@ -217,13 +221,14 @@ class Git:
         """
         self.toolbox_api.git_clone_repository(
             workspace_id=self.instance.id,
-            git_clone_request=GitCloneRequest(
+            # Built without validation, the arguments already match the schema
+            git_clone_request=GitCloneRequest.model_construct(
                 url=url,
                 branch=branch,
                 path=path,
                 username=username,
                 password=password,
-                commitId=commit_id,
+                commit_id=commit_id,
             )
         )
 
@@ -254,7 +259,7 @@ class Git:
         """
         self.toolbox_api.git_commit_changes(
             workspace_id=self.instance.id,
-            git_commit_request=GitCommitRequest(
+            git_commit_request=GitCommitRequest.model_construct(
                 path=path,
                 message=message,
                 author=author,
@@ -366,3 +371,73 @@ class Git:
             workspace_id=self.instance.id,
             path=path,
         )
+
+
+class AsyncGit:
+    """Provides Git operations within a Sandbox for asyncio code.
+
+    Wraps a Git handler and runs its blocking calls on worker threads, capping
+    how many are in flight at once.
+
+    Attributes:
+        git (Git): The wrapped Git handler.
+
+    Example:
+        ```python
+        git = AsyncGit(workspace.git)
+        statuses = await asyncio.gather(
+            git.status("/workspace/repo-a"),
+            git.status("/workspace/repo-b")
+        )
+        ```
+    """
+
+    def __init__(self, git: Git, max_concurrency: int = 16):
+        """Initializes a new AsyncGit instance.
+
+        Args:
+            git (Git): The Git handler to wrap, e.g. `workspace.git`.
+            max_concurrency (int): Maximum number of operations running at the same time.
+        """
+        self.git = git
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def add(self, path: str, files: List[str]) -> None:
+        """Stages files for commit. See Git.add()."""
+        await run_in_thread(self._semaphore, self.git.add, path, files)
+
+    async def branches(self, path: str) -> ListBranchResponse:
+        """Lists branches in the repository. See Git.branches()."""
+        return await run_in_thread(self._semaphore, self.git.branches, path)
+
+    async def clone(
+        self,
+        url: str,
+        path: str,
+        branch: Optional[str] = None,
+        commit_id: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> None:
+        """Clones a Git repository. See Git.clone()."""
+        await run_in_thread(self._semaphore, self.git.clone, url, path, branch, commit_id, username, password)
+
+    async def commit(self, path: str, message: str, author: str, email: str) -> None:
+        """Commits staged changes. See Git.commit()."""
+        await run_in_thread(self._semaphore, self.git.commit, path, message, author, email)
+
+    async def push(
+        self, path: str, username: Optional[str] = None, password: Optional[str] = None
+    ) -> None:
+        """Pushes local commits to the remote repository. See Git.push()."""
+        await run_in_thread(self._semaphore, self.git.push, path, username, password)
+
+    async def pull(
+        self, path: str, username: Optional[str] = None, password: Optional[str] = None
+    ) -> None:
+        """Pulls changes from the remote repository. See Git.pull()."""
+        await run_in_thread(self._semaphore, self.git.pull, path, username, password)
+
+    async def status(self, path: str) -> GitStatus:
+        """Gets the current Git repository status. See Git.status()."""
+        return await run_in_thread(self._semaphore, self.git.status, path)
@@ -33,54 +33,73 @@ Note:
     The LSP server must be started with start() before using any other methods,
     and should be stopped with stop() when no longer needed to free resources.
 """
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import itertools
+import threading
+from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+from urllib.parse import quote
 from daytona_api_client import (
     CompletionList,
     LspSymbol,
     ToolboxApi,
     LspServerRequest,
     LspDocumentRequest,
-    LspCompletionParams
+    LspCompletionParams,
+    Position as ApiPosition,
 )
-from daytona_sdk._utils.errors import intercept_errors
+from daytona_sdk._utils.cache import TTLCache
+from daytona_sdk._utils.concurrency import map_concurrently, run_in_thread
+from daytona_sdk._utils.errors import intercept_errors, to_daytona_error
 from .protocols import WorkspaceInstance
 
-
-class LspLanguageId(Enum):
+# How long batched did_open()/did_close() notifications are held before being sent
+_BATCH_DELAY = 0.05
+# Maximum number of batched notifications sent at the same time
+_BATCH_MAX_WORKERS = 4
+# Maximum number of notifications did_open_many()/did_close_many() send at the same time
+_NOTIFY_MAX_WORKERS = 8
+# Maximum number of document requests kept for reuse per server
+_DOC_REQUEST_CACHE_SIZE = 1024
+# Query results are kept briefly, since editors repeat the same queries while typing
+_QUERY_CACHE_SIZE = 256
+_COMPLETIONS_CACHE_TTL = 2.0
+_SYMBOLS_CACHE_TTL = 10.0
+
+
+class LspLanguageId(str, Enum):
     PYTHON = "python"
     TYPESCRIPT = "typescript"
     JAVASCRIPT = "javascript"
 
     def __str__(self):
+        # The str mixin alone still formats members as "LspLanguageId.PYTHON"
         return self.value
 
-    def __eq__(self, other):
-        if isinstance(other, str):
-            return self.value == other
-        return super().__eq__(other)
+
+# Members hash and compare like their values, so this maps both members and
+# plain strings to the value without going through Enum.__str__
+_LANGUAGE_ID_VALUES: Dict[str, str] = {member: member.value for member in LspLanguageId}
 
 
+@dataclass(slots=True, frozen=True)
 class Position:
     """Represents a position in a text document.
 
     This class represents a zero-based position within a text document,
-    specified by line number and character offset.
+    specified by line number and character offset. Positions are immutable
+    and hashable.
 
     Attributes:
         line (int): Zero-based line number in the document.
         character (int): Zero-based character offset on the line.
     """
-
-    def __init__(self, line: int, character: int):
-        """Initialize a new Position instance.
-
-        Args:
-            line (int): Zero-based line number in the document.
-            character (int): Zero-based character offset on the line.
-        """
-        self.line = line
-        self.character = character
+    line: int
+    character: int
 
 
 class LspServer:
@@ -89,18 +108,52 @@ class LspServer:
     This class implements a subset of the Language Server Protocol (LSP) to provide
     IDE-like features such as code completion, symbol search, and more.
 
+    With `batch=True`, did_open() and did_close() return immediately and the
+    notifications are sent in the background shortly after, concurrently for
+    different files. Any pending notifications for a file are sent before it is
+    queried, and an error from a background send is raised by the next call that
+    sends notifications.
+
+    Results of completions() and document_symbols() are cached for a few seconds.
+    Opening or closing a file through did_open() or did_close() drops the cached
+    results for that file. Identical completions() calls made while one is already
+    in flight wait for its result instead of sending another request.
+
     Attributes:
         language_id (LspLanguageId): The language server type (e.g., "python", "typescript").
         path_to_project (str): Absolute path to the project root directory.
         instance (WorkspaceInstance): The Sandbox instance this server belongs to.
     """
 
+    __slots__ = (
+        "language_id",
+        "path_to_project",
+        "toolbox_api",
+        "instance",
+        "_api_completions",
+        "_server_request",
+        "_doc_requests",
+        "_batch",
+        "_pending",
+        "_pending_lock",
+        "_flush_lock",
+        "_flush_timer",
+        "_flush_error",
+        "_completions_cache",
+        "_symbols_cache",
+        "_doc_versions",
+        "_version_counter",
+        "_inflight",
+        "_inflight_lock",
+    )
+
     def __init__(
         self,
         language_id: LspLanguageId,
         path_to_project: str,
         toolbox_api: ToolboxApi,
         instance: WorkspaceInstance,
+        batch: bool = False,
     ):
         """Initializes a new LSP server instance.
 
@@ -109,11 +162,43 @@ class LspServer:
             path_to_project (str): Absolute path to the project root directory.
             toolbox_api (ToolboxApi): API client for Sandbox operations.
             instance (WorkspaceInstance): The Sandbox instance this server belongs to.
+            batch (bool): Whether to send did_open() and did_close() notifications in the background.
         """
-        self.language_id = str(language_id)
+        self.language_id = _LANGUAGE_ID_VALUES.get(language_id) or str(language_id)
         self.path_to_project = path_to_project
         self.toolbox_api = toolbox_api
         self.instance = instance
+        # Called on every keystroke, so the Sandbox ID is bound up front
+        self._api_completions = functools.partial(toolbox_api.lsp_completions, workspace_id=instance.id)
+        # Same request for start() and stop(), so it's only built once
+        self._server_request = LspServerRequest(
+            language_id=self.language_id,
+            path_to_project=self.path_to_project,
+        )
+        # Path -> request sent by did_open()/did_close() for it. Requests never go
+        # stale, the cache is only there to bound memory and for its locking
+        self._doc_requests = TTLCache(_DOC_REQUEST_CACHE_SIZE, float("inf"))
+
+        self._batch = batch
+        # Path -> notifications ("open"/"close") waiting to be sent, in order
+        self._pending: Dict[str, List[str]] = {}
+        self._pending_lock = threading.Lock()
+        # Held while sending, so a query waits for notifications already in flight
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_error: Optional[Exception] = None
+
+        # (path, version, line, character) -> CompletionList, and path -> List[LspSymbol]
+        self._completions_cache = TTLCache(_QUERY_CACHE_SIZE, _COMPLETIONS_CACHE_TTL)
+        self._symbols_cache = TTLCache(_QUERY_CACHE_SIZE, _SYMBOLS_CACHE_TTL)
+        # Path -> version of the document, dropped by did_open()/did_close() so
+        # completions cached for an earlier version are no longer found. A path
+        # without a version gets a fresh one, so the cache can be bounded
+        self._doc_versions = TTLCache(_DOC_REQUEST_CACHE_SIZE, float("inf"))
+        self._version_counter = itertools.count(1)
+        # Completions key -> future of the request currently fetching it
+        self._inflight: Dict[tuple, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
 
     @intercept_errors(message_prefix="Failed to start LSP server: ")
     def start(self) -> None:
@@ -131,10 +216,7 @@ class LspServer:
         """
         self.toolbox_api.lsp_start(
             workspace_id=self.instance.id,
-            lsp_server_request=LspServerRequest(
-                language_id=self.language_id,
-                path_to_project=self.path_to_project,
-            ),
+            lsp_server_request=self._server_request,
         )
 
     @intercept_errors(message_prefix="Failed to stop LSP server: ")
@@ -150,12 +232,10 @@ class LspServer:
             lsp.stop()  # Clean up resources
             ```
         """
+        self._flush()
         self.toolbox_api.lsp_stop(
             workspace_id=self.instance.id,
-            lsp_server_request=LspServerRequest(
-                language_id=self.language_id,
-                path_to_project=self.path_to_project,
-            ),
+            lsp_server_request=self._server_request,
         )
 
     @intercept_errors(message_prefix="Failed to open file: ")
@@ -176,14 +256,27 @@ class LspServer:
             # Now can get completions, symbols, etc. for this file
             ```
         """
-        self.toolbox_api.lsp_did_open(
-            workspace_id=self.instance.id,
-            lsp_document_request=LspDocumentRequest(
-                language_id=self.language_id,
-                path_to_project=self.path_to_project,
-                uri=f"file://{path}",
-            ),
-        )
+        self._notify_many([path], "open")
+
+    @intercept_errors(message_prefix="Failed to open files: ")
+    def did_open_many(self, paths: List[str]) -> None:
+        """Notifies the language server that multiple files have been opened.
+
+        The notifications are sent concurrently, so opening many files takes about
+        as long as opening the slowest one.
+
+        Args:
+            paths (List[str]): Absolute paths to the opened files.
+
+        Example:
+            ```python
+            lsp.did_open_many([
+                "/workspace/project/src/index.ts",
+                "/workspace/project/src/utils.ts"
+            ])
+            ```
+        """
+        self._notify_many(paths, "open")
 
     @intercept_errors(message_prefix="Failed to close file: ")
     def did_close(self, path: str) -> None:
@@ -200,14 +293,53 @@ class LspServer:
             lsp.did_close("/workspace/project/src/index.ts")
             ```
         """
-        self.toolbox_api.lsp_did_close(
-            workspace_id=self.instance.id,
-            lsp_document_request=LspDocumentRequest(
-                language_id=self.language_id,
-                path_to_project=self.path_to_project,
-                uri=f"file://{path}",
-            ),
-        )
+        self._notify_many([path], "close")
+
+    @intercept_errors(message_prefix="Failed to close files: ")
+    def did_close_many(self, paths: List[str]) -> None:
+        """Notifies the language server that multiple files have been closed.
+
+        The notifications are sent concurrently, like in did_open_many().
+
+        Args:
+            paths (List[str]): Absolute paths to the closed files.
+
+        Example:
+            ```python
+            lsp.did_close_many([
+                "/workspace/project/src/index.ts",
+                "/workspace/project/src/utils.ts"
+            ])
+            ```
+        """
+        self._notify_many(paths, "close")
+
+    @contextlib.contextmanager
+    def document(self, path: str) -> Iterator["LspServer"]:
+        """Keeps a file open for the duration of a `with` block.
+
+        Sends did_open() on entry and did_close() on exit, even if the block raises.
+        With `batch=True`, the open notification goes out together with the first
+        query on the file and the close is sent with the next batch, so a one-shot
+        query costs a single round-trip of its own.
+
+        Args:
+            path (str): Absolute path to the file.
+
+        Returns:
+            LspServer: This LSP server, for use inside the block.
+
+        Example:
+            ```python
+            with lsp.document("/workspace/project/src/index.ts"):
+                symbols = lsp.document_symbols("/workspace/project/src/index.ts")
+            ```
+        """
+        self.did_open(path)
+        try:
+            yield self
+        finally:
+            self.did_close(path)
 
     @intercept_errors(message_prefix="Failed to get symbols from document: ")
     def document_symbols(self, path: str) -> List[LspSymbol]:
@@ -233,12 +365,17 @@ class LspServer:
                 print(f"{symbol.kind} {symbol.name}: {symbol.location}")
             ```
         """
-        return self.toolbox_api.lsp_document_symbols(
-            workspace_id=self.instance.id,
-            language_id=self.language_id,
-            path_to_project=self.path_to_project,
-            uri=f"file://{path}",
-        )
+        self._flush(path)
+        symbols = self._symbols_cache.get(path)
+        if symbols is None:
+            symbols = self.toolbox_api.lsp_document_symbols(
+                workspace_id=self.instance.id,
+                language_id=self.language_id,
+                path_to_project=self.path_to_project,
+                uri=_path_to_uri(path),
+            )
+            self._symbols_cache.set(path, symbols)
+        return symbols
 
     @intercept_errors(message_prefix="Failed to get symbols from workspace: ")
     def workspace_symbols(self, query: str) -> List[LspSymbol]:
@@ -266,6 +403,7 @@ class LspServer:
                 print(f"{symbol.name} in {symbol.location}")
             ```
         """
+        self._flush()
         return self.toolbox_api.lsp_workspace_symbols(
             workspace_id=self.instance.id,
             language_id=self.language_id,
@@ -273,7 +411,6 @@ class LspServer:
             query=query,
         )
 
-    @intercept_errors(message_prefix="Failed to get completions: ")
     def completions(self, path: str, position: Position) -> CompletionList:
         """Gets completion suggestions at a position in a file.
 
@@ -302,12 +439,238 @@ class LspServer:
                 print(f"{item.label} ({item.kind}): {item.detail}")
             ```
         """
-        return self.toolbox_api.lsp_completions(
-            workspace_id=self.instance.id,
-            lsp_completion_params=LspCompletionParams(
+        # Errors are converted inline rather than by @intercept_errors, this is called per keystroke
+        try:
+            self._flush(path)
+            key = (path, self._doc_version(path), position.line, position.character)
+            completions = self._completions_cache.get(key)
+            if completions is not None:
+                return completions
+
+            with self._inflight_lock:
+                future = self._inflight.get(key)
+                if future is not None:
+                    wait = True
+                else:
+                    wait = False
+                    future = concurrent.futures.Future()
+                    self._inflight[key] = future
+            if wait:
+                error = future.exception()
+                if error is None:
+                    return future.result()
+            else:
+                return self._fetch_completions(key, future, path, position)
+        except Exception as e:
+            raise to_daytona_error(e, "Failed to get completions: ")
+        # The shared request failed. Each waiter gets an error of its own, raising the
+        # shared exception would have every waiting thread add to its traceback
+        raise to_daytona_error(error, "Failed to get completions: ")
+
+    def _fetch_completions(
+        self, key: tuple, future: concurrent.futures.Future, path: str, position: Position
+    ) -> CompletionList:
+        """Requests completions, publishing the outcome to the requests waiting on `future`."""
+        try:
+            # Built without validation, the fields already match the schema
+            completions = self._api_completions(
+                lsp_completion_params=LspCompletionParams.model_construct(
+                    language_id=self.language_id,
+                    path_to_project=self.path_to_project,
+                    uri=_path_to_uri(path),
+                    position=ApiPosition.model_construct(
+                        line=position.line, character=position.character
+                    ),
+                ),
+            )
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._completions_cache.set(key, completions)
+            future.set_result(completions)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return completions
+
+    def _doc_request(self, path: str) -> LspDocumentRequest:
+        """Returns the request identifying a document to the language server.
+
+        Requests are only read by the API client, so one is built and validated
+        per path and then reused.
+        """
+        request = self._doc_requests.get(path)
+        if request is None:
+            request = LspDocumentRequest(
                 language_id=self.language_id,
                 path_to_project=self.path_to_project,
-                uri=f"file://{path}",
-                position=position,
-            ),
+                uri=_path_to_uri(path),
+            )
+            self._doc_requests.set(path, request)
+        return request
+
+    def _invalidate(self, path: str) -> None:
+        """Drops cached query results for a file."""
+        self._symbols_cache.delete(path)
+        self._doc_versions.delete(path)
+
+    def _doc_version(self, path: str) -> int:
+        """Returns the current version of a document, see _invalidate()."""
+        version = self._doc_versions.get(path)
+        if version is None:
+            version = next(self._version_counter)
+            self._doc_versions.set(path, version)
+        return version
+
+    def _notify_many(self, paths: List[str], event: str) -> None:
+        """Sends, or queues in batch mode, a notification for each of the given files."""
+        paths = list(dict.fromkeys(paths))
+        for path in paths:
+            self._invalidate(path)
+
+        if self._batch:
+            for path in paths:
+                self._queue(path, event)
+            return
+        map_concurrently(lambda path: self._notify(path, event), paths, _NOTIFY_MAX_WORKERS)
+
+    def _notify(self, path: str, event: str) -> None:
+        """Sends a did_open ("open") or did_close ("close") notification for a file."""
+        send = self.toolbox_api.lsp_did_open if event == "open" else self.toolbox_api.lsp_did_close
+        send(
+            workspace_id=self.instance.id,
+            lsp_document_request=self._doc_request(path),
         )
+
+    def _queue(self, path: str, event: str) -> None:
+        """Queues a notification for a file and schedules a background flush."""
+        with self._pending_lock:
+            events = self._pending.setdefault(path, [])
+            # Repeating the last notification for a file has no effect
+            if not events or events[-1] != event:
+                events.append(event)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(_BATCH_DELAY, self._flush_in_background)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_in_background(self) -> None:
+        with self._pending_lock:
+            self._flush_timer = None
+        try:
+            self._send_pending(None)
+        except Exception as e:
+            with self._pending_lock:
+                if self._flush_error is None:
+                    self._flush_error = e
+
+    def _flush(self, path: Optional[str] = None) -> None:
+        """Sends queued notifications, for one file or all of them.
+
+        Raises:
+            Exception: The error of a previous background flush, if it failed.
+        """
+        if not self._batch:
+            return
+        with self._pending_lock:
+            error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+        self._send_pending(path)
+
+    def _send_pending(self, path: Optional[str]) -> None:
+        with self._flush_lock:
+            with self._pending_lock:
+                if path is None:
+                    pending, self._pending = self._pending, {}
+                else:
+                    events = self._pending.pop(path, None)
+                    pending = {path: events} if events else {}
+
+            def send_events(item):
+                file_path, events = item
+                for event in events:
+                    self._notify(file_path, event)
+
+            map_concurrently(send_events, pending.items(), _BATCH_MAX_WORKERS)
+
+
+class AsyncLspServer:
+    """Provides Language Server Protocol functionality for asyncio code.
+
+    Wraps an LspServer and runs its blocking calls on worker threads, so queries
+    for many files can be awaited concurrently. The number of calls in flight
+    is capped.
+
+    Attributes:
+        server (LspServer): The wrapped LSP server.
+
+    Example:
+        ```python
+        lsp = AsyncLspServer(workspace.create_lsp_server("typescript", "/workspace/project"))
+        await lsp.start()
+        symbols = await asyncio.gather(*(lsp.document_symbols(path) for path in paths))
+        ```
+    """
+
+    def __init__(self, server: LspServer, max_concurrency: int = 16):
+        """Initializes a new AsyncLspServer instance.
+
+        Args:
+            server (LspServer): The LSP server to wrap.
+            max_concurrency (int): Maximum number of operations running at the same time.
+        """
+        self.server = server
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def start(self) -> None:
+        """Starts the language server. See LspServer.start()."""
+        await run_in_thread(self._semaphore, self.server.start)
+
+    async def stop(self) -> None:
+        """Stops the language server. See LspServer.stop()."""
+        await run_in_thread(self._semaphore, self.server.stop)
+
+    async def did_open(self, path: str) -> None:
+        """Notifies the language server that a file has been opened. See LspServer.did_open()."""
+        await run_in_thread(self._semaphore, self.server.did_open, path)
+
+    async def did_open_many(self, paths: List[str]) -> None:
+        """Notifies the language server that multiple files have been opened. See LspServer.did_open_many()."""
+        await run_in_thread(self._semaphore, self.server.did_open_many, paths)
+
+    async def did_close(self, path: str) -> None:
+        """Notifies the language server that a file has been closed. See LspServer.did_close()."""
+        await run_in_thread(self._semaphore, self.server.did_close, path)
+
+    async def did_close_many(self, paths: List[str]) -> None:
+        """Notifies the language server that multiple files have been closed. See LspServer.did_close_many()."""
+        await run_in_thread(self._semaphore, self.server.did_close_many, paths)
+
+    @contextlib.asynccontextmanager
+    async def document(self, path: str) -> AsyncIterator["AsyncLspServer"]:
+        """Keeps a file open for the duration of an `async with` block. See LspServer.document()."""
+        await self.did_open(path)
+        try:
+            yield self
+        finally:
+            await self.did_close(path)
+
+    async def document_symbols(self, path: str) -> List[LspSymbol]:
+        """Gets symbol information from a document. See LspServer.document_symbols()."""
+        return await run_in_thread(self._semaphore, self.server.document_symbols, path)
+
+    async def workspace_symbols(self, query: str) -> List[LspSymbol]:
+        """Searches for symbols across the entire Sandbox. See LspServer.workspace_symbols()."""
+        return await run_in_thread(self._semaphore, self.server.workspace_symbols, query)
+
+    async def completions(self, path: str, position: Position) -> CompletionList:
+        """Gets completion suggestions at a position in a file. See LspServer.completions()."""
+        return await run_in_thread(self._semaphore, self.server.completions, path, position)
+
+
+@functools.lru_cache(maxsize=4096)
+def _path_to_uri(path: str) -> str:
+    """Returns the percent-encoded file URI for an absolute path."""
+    return "file://" + quote(path, safe="/")
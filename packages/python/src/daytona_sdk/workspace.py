@@ -34,28 +34,39 @@ Note:
     The Sandbox must be in a 'started' state before performing operations.
 """
 
+import asyncio
+import functools
 import json
 import time
-from typing import Dict, Optional
-from daytona_sdk._utils.errors import intercept_errors
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional
+from daytona_sdk._utils.errors import intercept_errors, to_daytona_error
 from .filesystem import FileSystem
 from .git import Git
 from .process import Process
 from .lsp_server import LspServer, LspLanguageId
-from daytona_api_client import Workspace as ApiWorkspace, ToolboxApi, WorkspaceApi, WorkspaceInfo as ApiWorkspaceInfo
+from daytona_api_client import Workspace as ApiWorkspace, ToolboxApi, WorkspaceApi, WorkspaceInfo as ApiWorkspaceInfo, WorkspaceLabels
 from .protocols import WorkspaceCodeToolbox
 from dataclasses import dataclass
 from datetime import datetime
 from daytona_sdk._utils.errors import DaytonaError
 from enum import Enum
-from pydantic import Field
+from pydantic import Field, ValidationError
 from typing_extensions import Annotated
 from ._utils.enum import to_enum
-from ._utils.timeout import with_timeout
+from ._utils.timeout import remaining_time, with_timeout
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, see the `orjson` extra
+    _json_loads = json.loads
 
-@dataclass
-class WorkspaceTargetRegion(Enum):
+# Label values that aren't sent as plain str(value), keyed by exact type (bool can't be subclassed)
+_LABEL_CONVERTERS = {bool: lambda value: "true" if value else "false"}
+
+
+class WorkspaceTargetRegion(str, Enum):
     """Target regions for workspaces"""
     EU = "eu"
     US = "us"
@@ -64,13 +75,13 @@ class WorkspaceTargetRegion(Enum):
     def __str__(self):
         return self.value
 
-    def __eq__(self, other):
-        if isinstance(other, str):
-            return self.value == other
-        return super().__eq__(other)
+    @classmethod
+    def from_str(cls, value: str) -> Optional["WorkspaceTargetRegion"]:
+        """Returns the member with the given value, or None if there is none."""
+        return cls._value2member_map_.get(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceResources:
     """Resources allocated to a Sandbox.
 
@@ -96,8 +107,7 @@ class WorkspaceResources:
     disk: str
 
 
-@dataclass
-class WorkspaceState(Enum):
+class WorkspaceState(str, Enum):
     """States of a Sandbox."""
     CREATING = "creating"
     RESTORING = "restoring"
@@ -115,10 +125,10 @@ class WorkspaceState(Enum):
     def __str__(self):
         return self.value
 
-    def __eq__(self, other):
-        if isinstance(other, str):
-            return self.value == other
-        return super().__eq__(other)
+    @classmethod
+    def from_str(cls, value: str) -> Optional["WorkspaceState"]:
+        """Returns the member with the given value, or None if there is none."""
+        return cls._value2member_map_.get(value)
 
 
 class WorkspaceInfo(ApiWorkspaceInfo):
@@ -173,6 +183,30 @@ class WorkspaceInfo(ApiWorkspaceInfo):
         deprecated='The `provider_metadata` field is deprecated. Use `state`, `node_domain`, `region`, `class_name`, `updated_at`, `last_snapshot`, `resources`, `auto_stop_interval` instead.')]
 
 
+@dataclass(slots=True)
+class WorkspaceSummary:
+    """Lightweight summary of a Sandbox, as returned by `Daytona.list_summaries()`.
+
+    Unlike `Workspace`, a summary carries no API clients or code toolbox and
+    is built straight from the listing response.
+
+    Attributes:
+        id (str): Unique identifier for the Sandbox.
+        name (str): Display name of the Sandbox.
+        state (WorkspaceState): Current state of the Sandbox (e.g., "started", "stopped").
+        labels (Dict[str, str]): Custom labels attached to the Sandbox.
+        target (WorkspaceTargetRegion): Target environment where the Sandbox runs.
+        info (Optional[ApiWorkspaceInfo]): The workspace info as returned by the API, without
+            the parsing `Workspace.info()` does on top of it.
+    """
+    id: str
+    name: str
+    state: WorkspaceState
+    labels: Dict[str, str]
+    target: WorkspaceTargetRegion
+    info: Optional[ApiWorkspaceInfo] = None
+
+
 class WorkspaceInstance(ApiWorkspace):
     """Represents a Daytona workspace instance."""
     info: Optional[WorkspaceInfo]
@@ -216,13 +250,29 @@ class Workspace:
         self.workspace_api = workspace_api
         self.toolbox_api = toolbox_api
         self.code_toolbox = code_toolbox
-
-        # Initialize components
-        # File system operations
-        self.fs = FileSystem(instance, self.toolbox_api)
-        self.git = Git(self, self.toolbox_api, instance)  # Git operations
-        self.process = Process(
-            self.code_toolbox, self.toolbox_api, instance)  # Process execution
+        # Built from the provider metadata on first use, see get_preview_link()
+        self._preview_template: Optional[str] = None
+        # Labels and response of the last set_labels() call, see set_labels()
+        self._sent_labels: Optional[frozenset] = None
+        self._labels_response: Optional[WorkspaceLabels] = None
+
+    # Components are created on first use, control-plane code managing many
+    # workspaces often never touches them
+
+    @functools.cached_property
+    def fs(self) -> FileSystem:
+        """FileSystem: File system operations interface."""
+        return FileSystem(self.instance, self.toolbox_api)
+
+    @functools.cached_property
+    def git(self) -> Git:
+        """Git: Git operations interface."""
+        return Git(self, self.toolbox_api, self.instance)
+
+    @functools.cached_property
+    def process(self) -> Process:
+        """Process: Process execution interface."""
+        return Process(self.code_toolbox, self.toolbox_api, self.instance)
 
     def info(self) -> WorkspaceInfo:
         """Gets structured information about the Sandbox.
@@ -261,7 +311,7 @@ class Workspace:
         return response.dir
 
     def create_lsp_server(
-        self, language_id: LspLanguageId, path_to_project: str
+        self, language_id: LspLanguageId, path_to_project: str, batch: bool = False
     ) -> LspServer:
         """Creates a new Language Server Protocol (LSP) server instance.
 
@@ -271,6 +321,8 @@ class Workspace:
         Args:
             language_id (LspLanguageId): The language server type (e.g., LspLanguageId.PYTHON).
             path_to_project (str): Absolute path to the project root directory.
+            batch (bool): Whether to send did_open() and did_close() notifications in the
+                background instead of waiting for each of them.
 
         Returns:
             LspServer: A new LSP server instance configured for the specified language.
@@ -280,13 +332,15 @@ class Workspace:
             lsp = workspace.create_lsp_server("python", "/workspace/project")
             ```
         """
-        return LspServer(language_id, path_to_project, self.toolbox_api, self.instance)
+        return LspServer(language_id, path_to_project, self.toolbox_api, self.instance, batch)
 
     @intercept_errors(message_prefix="Failed to set labels: ")
     def set_labels(self, labels: Dict[str, str]) -> Dict[str, str]:
         """Sets labels for the Sandbox.
 
         Labels are key-value pairs that can be used to organize and identify Sandboxes.
+        Setting the same labels as the previous call returns its result without
+        contacting the server.
 
         Args:
             labels (Dict[str, str]): Dictionary of key-value pairs representing Sandbox labels.
@@ -305,10 +359,19 @@ class Workspace:
             ```
         """
         # Convert all values to strings and create the expected labels structure
-        string_labels = {k: str(v).lower() if isinstance(
-            v, bool) else str(v) for k, v in labels.items()}
+        string_labels = {k: _LABEL_CONVERTERS.get(type(v), str)(v) for k, v in labels.items()}
+        # Reconciliation loops tend to set the same labels over and over,
+        # only go to the server when they differ from the last ones sent
+        sent_labels = frozenset(string_labels.items())
+        if sent_labels == self._sent_labels:
+            return self._labels_response
+
         labels_payload = {"labels": string_labels}
-        return self.workspace_api.replace_labels(self.id, labels_payload)
+        response = self.workspace_api.replace_labels(self.id, labels_payload)
+        self._sent_labels = sent_labels
+        self._labels_response = response
+        self.instance.labels = response.labels
+        return response
 
     @intercept_errors(message_prefix="Failed to start workspace: ")
     @with_timeout(error_message=lambda self, timeout: f"Workspace {self.id} failed to start within the {timeout} seconds timeout period")
@@ -330,6 +393,8 @@ class Workspace:
             print("Workspace started successfully")
             ```
         """
+        # The workspace may come up on another node
+        self._preview_template = None
         self.workspace_api.start_workspace(self.id, _request_timeout=timeout or None)
         self.wait_for_workspace_start()
 
@@ -353,6 +418,7 @@ class Workspace:
             print("Workspace stopped successfully")
             ```
         """
+        self._preview_template = None
         self.workspace_api.stop_workspace(self.id, _request_timeout=timeout or None)
         self.wait_for_workspace_stop()
 
@@ -362,7 +428,7 @@ class Workspace:
         """Waits for the Sandbox to reach the 'started' state.
 
         This method polls the Sandbox status until it reaches the 'started' state
-        or encounters an error.
+        or encounters an error. Polls start 50ms apart and back off to once a second.
 
         Args:
             timeout (Optional[float]): Maximum time to wait in seconds. 0 means no timeout. Default is 60 seconds.
@@ -370,17 +436,17 @@ class Workspace:
         Raises:
             DaytonaError: If timeout is negative; If workspace fails to start or times out
         """
-        state = None
-        while state != "started":
+        for delay in _poll_delays():
             response = self.workspace_api.get_workspace(self.id)
-            provider_metadata = json.loads(response.info.provider_metadata)
-            state = provider_metadata.get('state', '')
+            state = WorkspaceState.from_str(_workspace_state(response))
 
-            if state == "error":
+            if state is WorkspaceState.STARTED:
+                return
+            if state is WorkspaceState.ERROR:
                 raise DaytonaError(
                     f"Workspace {self.id} failed to start with state: {state}, error reason: {response.error_reason}")
 
-            time.sleep(0.1)  # Wait 100ms between checks
+            time.sleep(delay)
 
     @intercept_errors(message_prefix="Failure during waiting for workspace to stop: ")
     @with_timeout(error_message=lambda self, timeout: f"Workspace {self.id} failed to become stopped within the {timeout} seconds timeout period")
@@ -389,6 +455,7 @@ class Workspace:
 
         This method polls the Sandbox status until it reaches the 'stopped' state
         or encounters an error. It will wait up to 60 seconds for the Sandbox to stop.
+        Polls start 50ms apart and back off to once a second.
 
         Args:
             timeout (Optional[float]): Maximum time to wait in seconds. 0 means no timeout. Default is 60 seconds.
@@ -396,23 +463,97 @@ class Workspace:
         Raises:
             DaytonaError: If timeout is negative. If Sandbox fails to stop or times out.
         """
-        state = None
-        while state != "stopped":
+        for delay in _poll_delays():
             try:
                 workspace_check = self.workspace_api.get_workspace(self.id)
-                provider_metadata = json.loads(
-                    workspace_check.info.provider_metadata)
-                state = provider_metadata.get('state')
+                state = WorkspaceState.from_str(_workspace_state(workspace_check))
 
-                if state == "error":
+                if state is WorkspaceState.STOPPED:
+                    return
+                if state is WorkspaceState.ERROR:
                     raise DaytonaError(
                         f"Workspace {self.id} failed to stop with status: {state}, error reason: {workspace_check.error_reason}")
-            except Exception as e:
-                # If there's a validation error, continue waiting
-                if "validation error" not in str(e):
-                    raise e
+            except ValidationError:
+                # The workspace can briefly fail to deserialize while stopping, keep waiting
+                pass
+
+            time.sleep(delay)
+
+    async def astart(self, timeout: Optional[float] = 60) -> None:
+        """Starts the Sandbox without blocking the event loop.
+
+        Async counterpart of start(). API calls run on worker threads and the waits
+        between state polls are asyncio sleeps, so starting many Sandboxes with
+        `asyncio.gather` doesn't hold a thread per pending Sandbox.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. 0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If timeout is negative. If workspace fails to start or times out.
+
+        Example:
+            ```python
+            await asyncio.gather(*(workspace.astart() for workspace in workspaces))
+            ```
+        """
+        self._preview_template = None
+        await _await_with_timeout(
+            self._astart(timeout),
+            timeout,
+            message_prefix="Failed to start workspace: ",
+            timeout_message=f"Workspace {self.id} failed to start within the {timeout} seconds timeout period",
+        )
+
+    async def astop(self, timeout: Optional[float] = 60) -> None:
+        """Stops the Sandbox without blocking the event loop.
+
+        Async counterpart of stop(), see astart().
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. 0 means no timeout. Default is 60 seconds.
+
+        Raises:
+            DaytonaError: If timeout is negative; If workspace fails to stop or times out
+
+        Example:
+            ```python
+            await workspace.astop()
+            ```
+        """
+        self._preview_template = None
+        await _await_with_timeout(
+            self._astop(timeout),
+            timeout,
+            message_prefix="Failed to stop workspace: ",
+            timeout_message=f"Workspace {self.id} failed to stop within the {timeout} seconds timeout period",
+        )
 
-            time.sleep(0.1)  # Wait 100ms between checks
+    async def _astart(self, timeout: Optional[float]) -> None:
+        await asyncio.to_thread(self.workspace_api.start_workspace, self.id, _request_timeout=timeout or None)
+        await self._await_state(WorkspaceState.STARTED, "start")
+
+    async def _astop(self, timeout: Optional[float]) -> None:
+        await asyncio.to_thread(self.workspace_api.stop_workspace, self.id, _request_timeout=timeout or None)
+        await self._await_state(WorkspaceState.STOPPED, "stop", skip_validation_errors=True)
+
+    async def _await_state(self, target: WorkspaceState, action: str, skip_validation_errors: bool = False) -> None:
+        """Polls the workspace like wait_for_workspace_start/stop, sleeping on the event loop."""
+        for delay in _poll_delays():
+            try:
+                response = await asyncio.to_thread(self.workspace_api.get_workspace, self.id)
+                state = WorkspaceState.from_str(_workspace_state(response))
+
+                if state is target:
+                    return
+                if state is WorkspaceState.ERROR:
+                    raise DaytonaError(
+                        f"Workspace {self.id} failed to {action} with state: {state}, error reason: {response.error_reason}")
+            except ValidationError:
+                if not skip_validation_errors:
+                    raise
+
+            await asyncio.sleep(delay)
 
     @intercept_errors(message_prefix="Failed to set auto-stop interval: ")
     def set_autostop_interval(self, interval: int) -> None:
@@ -454,13 +595,24 @@ class Workspace:
         Returns:
             The preview link for the workspace at the specified port
         """
-        provider_metadata = json.loads(self.instance.info.provider_metadata)
-        node_domain = provider_metadata.get('nodeDomain', '')
-        if not node_domain:
-            raise DaytonaError(
-                "Node domain not found in provider metadata. Please contact support.")
+        try:
+            # Ports given as strings, e.g. read from the environment, keep working
+            port = int(port)
+        except (TypeError, ValueError):
+            raise DaytonaError(f"Invalid port: {port!r}") from None
+        if not 0 < port < 65536:
+            raise DaytonaError("Port must be an integer between 1 and 65535")
+
+        template = self._preview_template
+        if template is None:
+            provider_metadata = _parse_provider_metadata(self.instance.info.provider_metadata)
+            node_domain = provider_metadata.get('nodeDomain', '')
+            if not node_domain:
+                raise DaytonaError(
+                    "Node domain not found in provider metadata. Please contact support.")
+            template = self._preview_template = f"https://{{port}}-{self.id}.{node_domain}"
 
-        return f"https://{port}-{self.id}.{node_domain}"
+        return template.format(port=port)
 
     @intercept_errors(message_prefix="Failed to archive workspace: ")
     def archive(self) -> None:
@@ -481,20 +633,12 @@ class Workspace:
         Returns:
             WorkspaceInfo: The converted WorkspaceInfo object
         """
-        provider_metadata = json.loads(instance.info.provider_metadata or '{}')
-        resources_data = provider_metadata.get('resources', provider_metadata)
+        provider_metadata = _parse_provider_metadata(instance.info.provider_metadata)
+        resources = _to_workspace_resources(provider_metadata)
+        state = provider_metadata.get('state', '')
+        snapshot_state_created_at = provider_metadata.get('snapshotStateCreatedAt')
 
-        # Extract resources with defaults
-        resources = WorkspaceResources(
-            cpu=str(resources_data.get('cpu', '1')),
-            gpu=str(resources_data.get('gpu')
-                    ) if resources_data.get('gpu') else None,
-            memory=str(resources_data.get('memory', '2')) + 'Gi',
-            disk=str(resources_data.get('disk', '10')) + 'Gi'
-        )
-
-        enum_state = to_enum(
-            WorkspaceState, provider_metadata.get('state', ''))
+        enum_state = to_enum(WorkspaceState, state)
         enum_target = to_enum(WorkspaceTargetRegion, instance.target)
 
         return WorkspaceInfo(
@@ -507,11 +651,11 @@ class Workspace:
             public=instance.public,
             target=enum_target or instance.target,
             resources=resources,
-            state=enum_state or provider_metadata.get('state', ''),
+            state=enum_state or state,
             error_reason=instance.error_reason,
             snapshot_state=provider_metadata.get('snapshotState'),
-            snapshot_state_created_at=datetime.fromisoformat(provider_metadata.get(
-                'snapshotStateCreatedAt')) if provider_metadata.get('snapshotStateCreatedAt') else None,
+            snapshot_state_created_at=datetime.fromisoformat(
+                snapshot_state_created_at) if snapshot_state_created_at else None,
             node_domain=provider_metadata.get('nodeDomain', ''),
             region=provider_metadata.get('region', ''),
             class_name=provider_metadata.get('class', ''),
@@ -521,3 +665,122 @@ class Workspace:
             created=instance.info.created or '',
             provider_metadata=instance.info.provider_metadata,
         )
+
+    @staticmethod
+    def _to_workspace_summary(instance: ApiWorkspace) -> WorkspaceSummary:
+        """Converts an API workspace instance to a WorkspaceSummary object.
+
+        Args:
+            instance (ApiWorkspace): The API workspace instance to convert
+
+        Returns:
+            WorkspaceSummary: The converted WorkspaceSummary object
+        """
+        # Same source of truth as the Workspace polling loops
+        state = _workspace_state(instance)
+
+        return WorkspaceSummary(
+            id=instance.id,
+            name=instance.name,
+            state=WorkspaceState.from_str(state) or state,
+            labels=instance.labels or {},
+            target=to_enum(WorkspaceTargetRegion,
+                           instance.target) or instance.target,
+            info=instance.info,
+        )
+
+
+def _workspace_state(instance: ApiWorkspace) -> str:
+    """Returns the state of a workspace as a string, e.g. "started".
+
+    Prefers the top-level `state` field of the API response and only falls back
+    to parsing the provider metadata when the server doesn't set it.
+    """
+    if instance.state is not None:
+        return instance.state.value
+    return _parse_provider_metadata(instance.info and instance.info.provider_metadata).get('state', '')
+
+
+async def _await_with_timeout(coro, timeout: Optional[float], message_prefix: str, timeout_message: str) -> None:
+    """Awaits a coroutine the way with_timeout and intercept_errors run a blocking call.
+
+    Args:
+        coro: The coroutine to await.
+        timeout (Optional[float]): Maximum time to wait in seconds. 0 or None means no timeout.
+        message_prefix (str): Prefix for the DaytonaError raised on failure.
+        timeout_message (str): Message for the error raised when the timeout expires.
+
+    Raises:
+        DaytonaError: If timeout is negative, the coroutine fails or the timeout expires.
+    """
+    if timeout is not None and timeout < 0:
+        coro.close()
+        raise to_daytona_error(DaytonaError("Timeout must be a non-negative number or None."), message_prefix)
+
+    try:
+        await asyncio.wait_for(coro, timeout or None)
+    except asyncio.TimeoutError:
+        raise to_daytona_error(TimeoutError(timeout_message), message_prefix)
+    except Exception as e:
+        raise to_daytona_error(e, message_prefix)
+
+
+def _to_workspace_resources(provider_metadata: Mapping) -> WorkspaceResources:
+    """Extracts the resources of a workspace from its provider metadata, with defaults.
+
+    Args:
+        provider_metadata (Mapping): The parsed provider metadata.
+
+    Returns:
+        WorkspaceResources: A new resources object, callers may modify it.
+    """
+    resources_data = provider_metadata.get('resources', provider_metadata)
+    cpu = resources_data.get('cpu')
+    gpu = resources_data.get('gpu')
+    memory = resources_data.get('memory')
+    disk = resources_data.get('disk')
+    if cpu is None and gpu is None and memory is None and disk is None:
+        # Nothing reported, skip the conversions
+        return WorkspaceResources(cpu='1', gpu=None, memory='2Gi', disk='10Gi')
+
+    return WorkspaceResources(
+        cpu=str(cpu) if cpu is not None else '1',
+        gpu=str(gpu) if gpu else None,
+        memory=f"{memory if memory is not None else '2'}Gi",
+        disk=f"{disk if disk is not None else '10'}Gi",
+    )
+
+
+def _poll_delays(initial: float = 0.05, maximum: float = 1.0, factor: float = 1.5) -> Iterator[float]:
+    """Yields the delays between state polls, growing exponentially up to a cap.
+
+    When polling inside a timed call, stops with a TimeoutError once the call's
+    deadline has passed, so a call whose caller already timed out doesn't keep
+    polling, and never sleeps past the deadline.
+    """
+    delay = initial
+    while True:
+        remaining = remaining_time()
+        if remaining is None:
+            yield delay
+        elif remaining > 0:
+            yield min(delay, remaining)
+        else:
+            raise TimeoutError("Timed out while polling the workspace state")
+        delay = min(delay * factor, maximum)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_provider_metadata(raw: Optional[str]) -> Mapping:
+    """Parses a workspace's provider metadata JSON, reusing the result for identical strings.
+
+    Polling sees the same metadata many times in a row, so parsing is cached on the
+    raw string. The result is shared between callers and therefore read-only.
+
+    Args:
+        raw (Optional[str]): The provider metadata as returned by the API.
+
+    Returns:
+        Mapping: The parsed metadata, empty if there is none.
+    """
+    return MappingProxyType(_json_loads(raw) if raw else {})